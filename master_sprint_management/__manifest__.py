@@ -1,6 +1,6 @@
 {
     "name": "Master Sprint Management",
-    "version": "15.0.2.0.0",
+    "version": "15.0.2.2.0",
     "category": "Project",
     "summary": "Agile Sprint Management for Odoo 15 Community (Stage-based board, no risky overrides)",
     "description": """
@@ -15,9 +15,10 @@ Master Sprint Management (Odoo 15 Community)
 """,
     "author": "Kais Akram",
     "website": "https://kaisakram.com",
-    "depends": ["project", "mail"],
+    "depends": ["project", "mail", "bus"],
     "data": [
     "security/ir.model.access.csv",
+    "data/ir_cron_data.xml",
 
     # =====================
     # CORE VIEWS (ÖNCE)
@@ -27,6 +28,9 @@ Master Sprint Management (Odoo 15 Community)
     "views/project_epic_views.xml",
     "views/project_task_type_views.xml",
     "views/project_task_views.xml",          
+    "views/project_sprint_close_job_views.xml",
+    "views/project_sprint_daily_snapshot_views.xml",
+    "views/project_sprint_perf_log_views.xml",
 
     # =====================
     # WIZARDS
@@ -36,12 +40,26 @@ Master Sprint Management (Odoo 15 Community)
     "wizard/project_sprint_create_wizard_views.xml",
     "wizard/sprint_move_wizard_views.xml",
 
+    # =====================
+    # REPORTS
+    # =====================
+    "report/project_sprint_velocity_report_views.xml",
+    "report/project_task_carryover_report_views.xml",
+
     # =====================
     # ACTIONS & MENUS (EN SON)
     # =====================
     "views/actions.xml",
     "views/menu_views.xml",
 ],
+    "assets": {
+        "web.assets_backend": [
+            "master_sprint_management/static/src/js/sprint_board_kanban.js",
+        ],
+        "web.assets_qweb": [
+            "master_sprint_management/static/src/xml/sprint_board.xml",
+        ],
+    },
     "installable": True,
     "application": True,
     "auto_install": False,
@@ -0,0 +1,64 @@
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.bus.controllers.main import BusController
+from odoo.addons.web.controllers.main import DataSet
+from ..models.project_task import BOARD_CHANNEL
+
+BOARD_CHANNEL_PREFIX = BOARD_CHANNEL % ""
+
+
+class SprintDataSet(DataSet):
+
+    @http.route()
+    def resequence(self, model, ids, field="sequence", offset=0):
+        """
+        Drag & drop on the backlog list (handle on backlog_rank) and on the
+        sprint board (whose kanban asks for backlog_rank) only rewrites the
+        moved tasks' ranks instead of renumbering every row of the group.
+        """
+        if model == "project.task" and field == "backlog_rank":
+            request.env[model].browse(ids)._resequence_backlog_rank()
+            return True
+        return super().resequence(model, ids, field=field, offset=offset)
+
+
+class SprintBoardBusController(BusController):
+
+    def _poll(self, dbname, channels, last, options):
+        """
+        Board notifications are sent on the sprint's record channel. Swap the
+        board channels a client asks for with the record channels of the
+        sprints the user can read, and drop the others.
+        """
+        channels = list(channels)
+        board_channels = [
+            c for c in channels if isinstance(c, str) and c.startswith(BOARD_CHANNEL_PREFIX)
+        ]
+        if board_channels:
+            channels = [c for c in channels if c not in board_channels]
+            Sprint = request.env["project.sprint"]
+            sprint_ids = [
+                int(c[len(BOARD_CHANNEL_PREFIX):])
+                for c in board_channels
+                if c[len(BOARD_CHANNEL_PREFIX):].isdigit()
+            ]
+            if request.session.uid and Sprint.check_access_rights("read", raise_exception=False):
+                channels.extend(
+                    (dbname, Sprint._name, sprint_id)
+                    for sprint_id in Sprint.search([("id", "in", sprint_ids)]).ids
+                )
+        return super()._poll(dbname, channels, last, options)
+
+
+class SprintBoardController(http.Controller):
+
+    @http.route("/master_sprint_management/board/header", type="json", auth="user")
+    def board_header(self, sprint_id):
+        return request.env["project.sprint"].browse(sprint_id).get_board_header()
+
+    @http.route("/master_sprint_management/board/delta", type="json", auth="user")
+    def board_delta(self, sprint_id, since=None, ids_hash=None, etag=None):
+        return request.env["project.sprint"].browse(sprint_id).get_board_delta(
+            since=since, ids_hash=ids_hash, etag=etag
+        )
@@ -0,0 +1,7 @@
+from odoo import SUPERUSER_ID, api
+
+
+def migrate(cr, version):
+    """Fill the new stored sprint done/open counters from existing tasks."""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env["project.sprint"].search([])._rebuild_task_counters()
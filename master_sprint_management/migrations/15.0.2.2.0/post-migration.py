@@ -0,0 +1,20 @@
+from odoo import SUPERUSER_ID, api
+
+
+def migrate(cr, version):
+    """Rank existing tasks in their current (sequence, id) order."""
+    cr.execute(
+        """
+        WITH ordered AS (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY project_id ORDER BY sequence, id) AS position
+              FROM project_task
+             WHERE project_id IS NOT NULL
+        )
+        UPDATE project_task task
+           SET backlog_rank = LPAD(ordered.position::text, 12, '0')
+          FROM ordered
+         WHERE task.id = ordered.id
+        """
+    )
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env["project.project"].with_context(active_test=False).search([])._rebalance_backlog_ranks()
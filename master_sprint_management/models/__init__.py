@@ -1,5 +1,10 @@
 from . import project_project
 from . import project_sprint
+from . import project_sprint_close_job
+from . import project_sprint_daily_snapshot
+from . import project_sprint_load_data
+from . import project_sprint_perf_log
 from . import project_epic
 from . import project_task
+from . import project_task_sprint_history
 from . import project_task_type
@@ -0,0 +1,99 @@
+"""
+Lexorank-style keys for backlog ordering.
+
+Keys are base-36 strings compared lexicographically. A key never ends with
+the zero digit, so there is always room for a new key between two others:
+moving a task only rewrites that task.
+"""
+
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANK_BASE = len(RANK_DIGITS)
+
+# Appended keys are fixed-width numbers spaced by RANK_STEP
+RANK_WIDTH = 8
+RANK_STEP = RANK_BASE ** 4
+
+# Keys longer than this are rewritten by the rebalancer
+RANK_MAX_LENGTH = 16
+
+
+def _encode(number, width=RANK_WIDTH):
+    digits = []
+    for _i in range(width):
+        number, digit = divmod(number, RANK_BASE)
+        digits.append(RANK_DIGITS[digit])
+    return "".join(reversed(digits)).rstrip(RANK_DIGITS[0])
+
+
+def _decode(key, width=RANK_WIDTH):
+    number = 0
+    for char in key[:width].ljust(width, RANK_DIGITS[0]):
+        number = number * RANK_BASE + RANK_DIGITS.index(char)
+    return number
+
+
+def rank_between(before=None, after=None):
+    """Return a key sorting strictly between before and after (None = open end)"""
+    before = before or ""
+    if after is not None and before >= after:
+        raise ValueError("%r must sort before %r" % (before, after))
+
+    if after is not None:
+        # Keep the common prefix and split the remainder
+        n = 0
+        while (before[n] if n < len(before) else RANK_DIGITS[0]) == after[n]:
+            n += 1
+        if n:
+            return after[:n] + rank_between(before[n:], after[n:])
+
+    digit_before = RANK_DIGITS.index(before[0]) if before else 0
+    digit_after = RANK_DIGITS.index(after[0]) if after is not None else RANK_BASE
+    if digit_after - digit_before > 1:
+        return RANK_DIGITS[(digit_before + digit_after + 1) // 2]
+    if after is not None and len(after) > 1:
+        return after[:1]
+    return RANK_DIGITS[digit_before] + rank_between(before[1:], None)
+
+
+def rank_after(key=None):
+    """Return a key after `key`, stepping so that appends keep keys short"""
+    if not key:
+        return _encode(RANK_STEP)
+    number = _decode(key) + RANK_STEP
+    if number < RANK_BASE ** RANK_WIDTH:
+        return _encode(number)
+    return rank_between(key, None)
+
+
+def evenly_spaced_ranks(count):
+    """Return `count` ascending keys spread over the fixed-width key space"""
+    step = min(RANK_STEP, RANK_BASE ** RANK_WIDTH // (count + 1))
+    return [_encode((i + 1) * step) for i in range(count)]
+
+
+def longest_increasing(ranks):
+    """Indexes of a longest strictly increasing subsequence, ignoring empty ranks"""
+    tails = []  # index of the smallest tail for each subsequence length
+    parents = {}
+    for i, rank in enumerate(ranks):
+        if not rank:
+            continue
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if ranks[tails[mid]] < rank:
+                lo = mid + 1
+            else:
+                hi = mid
+        parents[i] = tails[lo - 1] if lo else None
+        if lo == len(tails):
+            tails.append(i)
+        else:
+            tails[lo] = i
+
+    keep = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        keep.add(i)
+        i = parents[i]
+    return keep
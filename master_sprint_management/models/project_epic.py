@@ -28,24 +28,48 @@ class ProjectEpic(models.Model):
         compute="_compute_display_completion",
     )
 
-    @api.depends("task_ids", "task_ids.stage_id", "task_ids.stage_id.fold")
+    @api.depends("task_ids", "task_ids.is_sprint_done")
     def _compute_display_completion(self):
+        epic_ids = [eid for eid in self._origin.ids if eid]
+        totals = dict.fromkeys(epic_ids, 0)
+        done = dict.fromkeys(epic_ids, 0)
+        if epic_ids:
+            groups = self.env["project.task"].read_group(
+                [("epic_id", "in", epic_ids)],
+                ["epic_id", "is_sprint_done"],
+                ["epic_id", "is_sprint_done"],
+                lazy=False,
+            )
+            for group in groups:
+                epic_id = group["epic_id"][0]
+                totals[epic_id] += group["__count"]
+                if group["is_sprint_done"]:
+                    done[epic_id] += group["__count"]
+
         for epic in self:
-            if not epic.task_count:
+            total = totals.get(epic._origin.id, 0)
+            if not total:
                 epic.display_completion_percentage = 0.0
                 continue
-            
-            done_tasks = epic.task_ids.filtered(
-                lambda t: t.stage_id and (t.stage_id.is_closed or t.stage_id.fold)
-            )
+
             epic.display_completion_percentage = round(
-                (len(done_tasks) / epic.task_count) * 100, 2
+                (done[epic._origin.id] / total) * 100, 2
             )
 
     @api.depends("task_ids")
     def _compute_task_count(self):
+        epic_ids = [eid for eid in self._origin.ids if eid]
+        counts = {}
+        if epic_ids:
+            groups = self.env["project.task"].read_group(
+                [("epic_id", "in", epic_ids)],
+                ["epic_id"],
+                ["epic_id"],
+                lazy=False,
+            )
+            counts = {g["epic_id"][0]: g["__count"] for g in groups}
         for epic in self:
-            epic.task_count = len(epic.task_ids)
+            epic.task_count = counts.get(epic._origin.id, 0)
 
     def action_view_epic_tasks(self):
         self.ensure_one()
@@ -2,6 +2,17 @@ from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 from datetime import timedelta
 
+from .backlog_rank import RANK_MAX_LENGTH, evenly_spaced_ranks
+from .project_sprint_perf_log import perf_logged
+
+# Default sprint board stages of a sprint-managed project
+SPRINT_STAGE_TEMPLATE = [
+    {"name": "To Do", "sequence": 10, "fold": False},
+    {"name": "In Progress", "sequence": 20, "fold": False},
+    {"name": "Blocked", "sequence": 30, "fold": False},
+    {"name": "Done", "sequence": 40, "fold": True},
+]
+
 
 class ProjectProject(models.Model):
     _inherit = "project.project"
@@ -15,6 +26,33 @@ class ProjectProject(models.Model):
         help="Enable sprint, backlog and epic features for this project",
     )
 
+    sprint_close_log_mode = fields.Selection(
+        [
+            ("task", "One note per task"),
+            ("summary", "One summary note on the sprint"),
+        ],
+        string="Sprint Close Log",
+        default="task",
+        required=True,
+        help="How tasks carried over when a sprint is closed are logged in the chatter. "
+             "A summary note on the sprint always notifies each assignee once; "
+             "\"One note per task\" also logs a note on every moved task.",
+    )
+    sprint_rollover_policy = fields.Selection(
+        [
+            ("manual", "Manual close"),
+            ("new", "Close and carry over to a new sprint"),
+            ("existing", "Close and carry over to the next planned sprint"),
+            ("backlog", "Close and move incomplete tasks to the backlog"),
+        ],
+        string="Sprint Rollover",
+        default="manual",
+        required=True,
+        help="What a scheduled job does with an active sprint past its end date. "
+             "The next planned sprint (or the new one) is started automatically; "
+             "without a planned sprint, a new one is created.",
+    )
+
     sprint_ids = fields.One2many(
         "project.sprint",
         "project_id",
@@ -47,7 +85,8 @@ class ProjectProject(models.Model):
         "project.sprint",
         string="Active Sprint",
         compute="_compute_active_sprint",
-        store=False,
+        store=True,
+        index=True,
     )
 
     # --------------------------------------------------
@@ -62,37 +101,56 @@ class ProjectProject(models.Model):
             project.epic_count = len(project.epic_ids)
 
     @api.depends("task_ids", "task_ids.sprint_id", "use_sprint_management")
+    @perf_logged()
     def _compute_backlog_task_count(self):
+        # Stored compute: the ORM batches every project touched since the
+        # last flush into one call, so a single grouped COUNT serves them all
+        project_ids = [
+            pid for pid in self.filtered("use_sprint_management")._origin.ids if pid
+        ]
+        counts = {}
+        if project_ids:
+            groups = self.env["project.task"].read_group(
+                [
+                    ("project_id", "in", project_ids),
+                    ("sprint_id", "=", False),
+                ],
+                ["project_id"],
+                ["project_id"],
+                lazy=False,
+            )
+            counts = {g["project_id"][0]: g["__count"] for g in groups}
+
         for project in self:
             if project.use_sprint_management:
-                project.backlog_task_count = len(
-                    project.task_ids.filtered(lambda t: not t.sprint_id)
-                )
+                project.backlog_task_count = counts.get(project._origin.id, 0)
             else:
                 project.backlog_task_count = 0
 
+    @api.depends("sprint_ids", "sprint_ids.state")
+    @perf_logged()
     def _compute_active_sprint(self):
+        active_sprints = self.env["project.sprint"].search(
+            [
+                ("project_id", "in", [pid for pid in self._origin.ids if pid]),
+                ("state", "=", "active"),
+            ]
+        )
+        sprint_by_project = {s.project_id.id: s for s in active_sprints}
         for project in self:
-            project.active_sprint_id = self.env["project.sprint"].search(
-                [
-                    ("project_id", "=", project.id),
-                    ("state", "=", "active"),
-                ],
-                limit=1,
-            )
+            project.active_sprint_id = sprint_by_project.get(project._origin.id, False)
 
     # --------------------------------------------------
     # ORM OVERRIDES
     # --------------------------------------------------
-    @api.model
-    def create(self, vals):
-        project = super().create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        projects = super().create(vals_list)
 
         # If flag is TRUE during project creation
-        if project.use_sprint_management:
-            project._ensure_sprint_stages()
+        projects._ensure_sprint_stages()
 
-        return project
+        return projects
 
     def write(self, vals):
         res = super().write(vals)
@@ -109,37 +167,105 @@ class ProjectProject(models.Model):
     def _ensure_sprint_stages(self):
         """
         Create default kanban stages for sprint board
-        (only once per project)
+        (only once per project).
+        Projects that already have stages are found with one query and the
+        missing stages of the whole batch are created at once. With the
+        master_sprint_management.share_sprint_stages parameter, projects are
+        linked to one shared stage set instead of getting their own copy.
         """
+        project_ids = [pid for pid in self.filtered("use_sprint_management").ids if pid]
+        if not project_ids:
+            return
+
         TaskType = self.env["project.task.type"]
+        TaskType.flush(["project_ids"])
+        field = TaskType._fields["project_ids"]
+        self.env.cr.execute(
+            "SELECT DISTINCT {project} FROM {rel} WHERE {project} = ANY(%s)".format(
+                rel=field.relation, project=field.column2
+            ),
+            [project_ids],
+        )
+        with_stages = {row[0] for row in self.env.cr.fetchall()}
+        missing = [pid for pid in project_ids if pid not in with_stages]
+        if not missing:
+            return
+
+        share = self.env["ir.config_parameter"].sudo().get_param(
+            "master_sprint_management.share_sprint_stages"
+        )
+        if share:
+            stages = TaskType.search([("is_sprint_template", "=", True)])
+            if not stages:
+                stages = TaskType.create([
+                    dict(stage, use_in_sprint_board=True, is_sprint_template=True)
+                    for stage in SPRINT_STAGE_TEMPLATE
+                ])
+            stages.write({"project_ids": [(4, pid) for pid in missing]})
+        else:
+            TaskType.create([
+                dict(stage, project_ids=[(6, 0, [pid])], use_in_sprint_board=True)
+                for pid in missing
+                for stage in SPRINT_STAGE_TEMPLATE
+            ])
+
+    def _check_can_start_sprint(self, sprint=None):
+        """Raise if another sprint than `sprint` is already active in this project"""
+        self.ensure_one()
+        active_sprint = self.active_sprint_id
+        if active_sprint and active_sprint != sprint:
+            raise UserError(
+                _(
+                    'There is already an active sprint "%s" in this project. '
+                    "Please close it before starting a new one."
+                )
+                % active_sprint.name
+            )
 
+    def _rebalance_backlog_ranks(self):
+        """Respace the backlog ranks of these projects, keeping the current order"""
+        self.env["project.task"].flush(["project_id", "backlog_rank"])
         for project in self:
-            if not project.use_sprint_management:
-                continue
-
-            # Do not recreate if at least one stage is already linked to the project
-            existing_stage = TaskType.search(
-                [("project_ids", "in", project.id)],
-                limit=1,
+            self.env.cr.execute(
+                """
+                SELECT id
+                  FROM project_task
+                 WHERE project_id = %s
+              ORDER BY backlog_rank NULLS LAST, id
+                """,
+                [project.id],
             )
-            if existing_stage:
+            task_ids = [row[0] for row in self.env.cr.fetchall()]
+            if not task_ids:
                 continue
+            self.env.cr.execute(
+                """
+                UPDATE project_task task
+                   SET backlog_rank = ranked.rank,
+                       write_date = NOW() AT TIME ZONE 'UTC'
+                  FROM unnest(%s::int[], %s::varchar[]) AS ranked(id, rank)
+                 WHERE task.id = ranked.id
+                """,
+                [task_ids, evenly_spaced_ranks(len(task_ids))],
+            )
+        # write_date moves too, so that boards syncing by delta pick up the new order
+        self.env["project.task"].invalidate_cache(["backlog_rank", "write_date"])
 
-            stages = [
-                {"name": "To Do", "sequence": 10, "fold": False},
-                {"name": "In Progress", "sequence": 20, "fold": False},
-                {"name": "Blocked", "sequence": 30, "fold": False},
-                {"name": "Done", "sequence": 40, "fold": True},
-            ]
-
-            for stage in stages:
-                TaskType.create({
-                    "name": stage["name"],
-                    "sequence": stage["sequence"],
-                    "fold": stage["fold"],
-                    "project_ids": [(6, 0, [project.id])],
-                    "use_in_sprint_board": True,
-                })
+    @api.model
+    def _cron_rebalance_backlog_ranks(self):
+        """Respace projects whose keys grew too long or that have unranked tasks"""
+        self.env["project.task"].flush(["project_id", "backlog_rank"])
+        self.env.cr.execute(
+            """
+            SELECT DISTINCT project_id
+              FROM project_task
+             WHERE project_id IS NOT NULL
+               AND (backlog_rank IS NULL OR LENGTH(backlog_rank) > %s)
+            """,
+            [RANK_MAX_LENGTH],
+        )
+        project_ids = [row[0] for row in self.env.cr.fetchall()]
+        self.browse(project_ids)._rebalance_backlog_ranks()
 
     # --------------------------------------------------
     # ACTIONS
@@ -218,9 +344,7 @@ class ProjectProject(models.Model):
             ).id,
             "domain": [
                 ("project_id", "=", self.id),
-                "|",
-                ("sprint_id.state", "!=", "closed"),
-                ("sprint_id", "=", False),
+                ("sprint_state", "in", ["backlog", "waiting", "active"]),
             ],
             "context": {
                 "default_project_id": self.id,
@@ -1,6 +1,52 @@
 # -*- coding: utf-8 -*-
-from odoo import api, fields, models, _
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from markupsafe import escape
+
+from odoo import api, fields, models, tools, _
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import split_every
+
+from .project_sprint_perf_log import perf_logged
+from .project_task import BOARD_CHANNEL
+
+_logger = logging.getLogger(__name__)
+
+# Partial unique index: at most one active sprint per project
+ACTIVE_SPRINT_INDEX = "project_sprint_single_active_idx"
+
+# Sprint board cards: compact payload of the board delta sync
+BOARD_CARD_FIELDS = [
+    "name",
+    "priority",
+    "kanban_state",
+    "user_ids",
+    "epic_id",
+    "tag_ids",
+    "date_deadline",
+    "backlog_rank",
+    "stage_id",
+]
+
+# write_date is the transaction start time: re-send cards written shortly
+# before the cursor so that slow transactions committing late are not missed
+BOARD_SYNC_OVERLAP = timedelta(seconds=30)
+
+# Sprints created when closing with "new sprint" are monthly
+FOLLOWUP_SPRINT_LENGTH = timedelta(weeks=4)
+FOLLOWUP_MONTH_NAMES = {
+    1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan",
+    5: "Mayıs", 6: "Haziran", 7: "Temmuz", 8: "Ağustos",
+    9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
+}
+
+# Expired sprints closed per batch by the rollover cron
+DEFAULT_ROLLOVER_BATCH_SIZE = 50
+
+
+def _hash_ids(ids):
+    return hashlib.sha1(",".join(map(str, sorted(ids))).encode()).hexdigest()
 
 
 class ProjectSprint(models.Model):
@@ -77,6 +123,56 @@ class ProjectSprint(models.Model):
         store=True,
     )
 
+    # --------------------------------------------------
+    # LIVE COUNTERS (maintained by project.task deltas)
+    # --------------------------------------------------
+    done_count = fields.Integer(
+        string="Done Tasks",
+        readonly=True,
+        default=0,
+        copy=False,
+    )
+
+    open_count = fields.Integer(
+        string="Open Tasks",
+        readonly=True,
+        default=0,
+        copy=False,
+    )
+
+    completion_percentage = fields.Float(
+        string="Completion % (Live)",
+        readonly=True,
+        default=0.0,
+        copy=False,
+    )
+
+    committed_points = fields.Float(
+        string="Committed Points",
+        readonly=True,
+        default=0.0,
+        copy=False,
+    )
+
+    done_points = fields.Float(
+        string="Done Points",
+        readonly=True,
+        default=0.0,
+        copy=False,
+    )
+
+    capacity_points = fields.Float(
+        string="Capacity (Points)",
+        tracking=True,
+        help="Story points the team can take on in this sprint. Zero means no capacity check.",
+    )
+
+    assignee_load = fields.Html(
+        string="Load per Assignee",
+        compute="_compute_assignee_load",
+        sanitize=False,
+    )
+
     # --------------------------------------------------
     # SNAPSHOT (ON CLOSE)
     # --------------------------------------------------
@@ -98,6 +194,48 @@ class ProjectSprint(models.Model):
         default=0.0,
     )
 
+    snapshot_committed_points = fields.Float(
+        string="Committed Points (Snapshot)",
+        readonly=True,
+        default=0.0,
+    )
+
+    snapshot_done_points = fields.Float(
+        string="Done Points (Snapshot)",
+        readonly=True,
+        default=0.0,
+    )
+
+    # --------------------------------------------------
+    # BACKGROUND CLOSE
+    # --------------------------------------------------
+    close_job_id = fields.Many2one(
+        "project.sprint.close.job",
+        string="Close Job",
+        readonly=True,
+        copy=False,
+    )
+
+    close_job_state = fields.Selection(
+        related="close_job_id.state",
+        string="Close Job Status",
+    )
+
+    close_job_progress = fields.Float(
+        related="close_job_id.progress",
+        string="Close Progress",
+    )
+
+    rollover_target_id = fields.Many2one(
+        "project.sprint",
+        string="Rollover Target",
+        readonly=True,
+        copy=False,
+        ondelete="set null",
+        help="Sprint chosen or created by the rollover job to receive the incomplete "
+             "tasks of this expired sprint, kept so that a rerun reuses it.",
+    )
+
     # --------------------------------------------------
     # DISPLAY (LIVE / SNAPSHOT)
     # --------------------------------------------------
@@ -116,44 +254,120 @@ class ProjectSprint(models.Model):
         compute="_compute_display",
     )
 
+    display_committed_points = fields.Float(
+        string="Committed Points",
+        compute="_compute_display",
+    )
+
+    display_done_points = fields.Float(
+        string="Done Points",
+        compute="_compute_display",
+    )
+
+    def init(self):
+        # Board, backlog and "next sprint" lookups filter on these
+        tools.create_index(
+            self.env.cr, "project_sprint_project_state_idx", self._table, ["project_id", "state"]
+        )
+        tools.create_index(
+            self.env.cr, "project_sprint_project_start_date_idx", self._table, ["project_id", "start_date"]
+        )
+        self._create_active_sprint_index()
+
+    def _create_active_sprint_index(self):
+        if tools.index_exists(self.env.cr, ACTIVE_SPRINT_INDEX):
+            return
+
+        self.env.cr.execute(
+            """
+            SELECT project_id
+              FROM project_sprint
+             WHERE state = 'active'
+          GROUP BY project_id
+            HAVING COUNT(*) > 1
+             LIMIT 1
+            """
+        )
+        if self.env.cr.fetchone():
+            _logger.warning(
+                "Some projects have several active sprints, index %s not created. "
+                "Close the extra sprints and update the module again.",
+                ACTIVE_SPRINT_INDEX,
+            )
+            return
+
+        self.env.cr.execute(
+            """
+            CREATE UNIQUE INDEX %s
+                ON project_sprint (project_id)
+             WHERE state = 'active'
+            """
+            % ACTIVE_SPRINT_INDEX
+        )
+
     # --------------------------------------------------
     # COMPUTES
     # --------------------------------------------------
     @api.depends("task_ids")
+    @perf_logged()
     def _compute_task_count(self):
+        sprint_ids = [sid for sid in self._origin.ids if sid]
+        counts = {}
+        if sprint_ids:
+            groups = self.env["project.task"].read_group(
+                [("sprint_id", "in", sprint_ids)],
+                ["sprint_id"],
+                ["sprint_id"],
+                lazy=False,
+            )
+            counts = {g["sprint_id"][0]: g["__count"] for g in groups}
         for sprint in self:
-            sprint.task_count = len(sprint.task_ids)
+            sprint.task_count = counts.get(sprint._origin.id, 0)
 
     @api.depends(
         "state",
-        "task_count",
-        "task_ids.stage_id",
-        "task_ids.stage_id.fold",
+        "done_count",
+        "open_count",
+        "completion_percentage",
         "snapshot_task_count",
         "snapshot_done_count",
         "snapshot_completion_percentage",
+        "committed_points",
+        "done_points",
+        "snapshot_committed_points",
+        "snapshot_done_points",
     )
+    @perf_logged()
     def _compute_display(self):
         for sprint in self:
             if sprint.state == "closed" and sprint.snapshot_task_count:
                 sprint.display_task_count = sprint.snapshot_task_count
                 sprint.display_done_count = sprint.snapshot_done_count
                 sprint.display_completion_percentage = sprint.snapshot_completion_percentage
+                sprint.display_committed_points = sprint.snapshot_committed_points
+                sprint.display_done_points = sprint.snapshot_done_points
                 continue
 
-            done_tasks = sprint.task_ids.filtered(
-                lambda t: t.stage_id and (t.stage_id.is_closed or t.stage_id.fold)
-            )
+            sprint.display_task_count = sprint.done_count + sprint.open_count
+            sprint.display_done_count = sprint.done_count
+            sprint.display_completion_percentage = sprint.completion_percentage
+            sprint.display_committed_points = sprint.committed_points
+            sprint.display_done_points = sprint.done_points
 
-            sprint.display_task_count = sprint.task_count
-            sprint.display_done_count = len(done_tasks)
-
-            if sprint.task_count:
-                sprint.display_completion_percentage = round(
-                    (len(done_tasks) / sprint.task_count) * 100, 2
-                )
-            else:
-                sprint.display_completion_percentage = 0.0
+    def _compute_assignee_load(self):
+        load = self._read_assignee_load()
+        for sprint in self:
+            rows = "".join(
+                "<tr><td>%s</td><td class='text-right'>%d</td><td class='text-right'>%s</td></tr>"
+                % (escape(line["name"]), line["task_count"], line["points"])
+                for line in load.get(sprint._origin.id, [])
+            )
+            sprint.assignee_load = rows and (
+                "<table class='table table-sm'><thead><tr><th>%s</th>"
+                "<th class='text-right'>%s</th><th class='text-right'>%s</th></tr></thead>"
+                "<tbody>%s</tbody></table>"
+                % (escape(_("Assignee")), escape(_("Tasks")), escape(_("Points")), rows)
+            )
 
     @api.onchange("add_tasks_from_backlog")
     def _onchange_add_tasks_from_backlog(self):
@@ -181,22 +395,7 @@ class ProjectSprint(models.Model):
         """Open wizard to configure and start this sprint (Jira-style)"""
         self.ensure_one()
 
-        active_sprint = self.search(
-            [
-                ("project_id", "=", self.project_id.id),
-                ("state", "=", "active"),
-                ("id", "!=", self.id),
-            ],
-            limit=1,
-        )
-        if active_sprint:
-            raise UserError(
-                _(
-                    'There is already an active sprint "%s" in this project. '
-                    "Please close it before starting a new one."
-                )
-                % active_sprint.name
-            )
+        self.project_id._check_can_start_sprint(self)
 
         return {
             "name": _("Start Sprint"),
@@ -217,9 +416,8 @@ class ProjectSprint(models.Model):
     def action_close_sprint(self):
         self.ensure_one()
 
-        incomplete_tasks = self.task_ids.filtered(
-            lambda t: not (t.stage_id and (t.stage_id.is_closed or t.stage_id.fold))
-        )
+        if self.close_job_state in ("pending", "running"):
+            raise UserError(_("This sprint is already being closed in the background."))
 
         # Always open wizard (Jira-like: just ask for date)
         next_sprint = self.search(
@@ -245,6 +443,17 @@ class ProjectSprint(models.Model):
             },
         }
 
+    def action_view_burndown(self):
+        self.ensure_one()
+        return {
+            "name": _("Burndown - %s") % self.name,
+            "type": "ir.actions.act_window",
+            "res_model": "project.sprint.daily.snapshot",
+            "view_mode": "graph,tree",
+            "domain": [("sprint_id", "=", self.id)],
+            "context": {"search_default_group_date": 1},
+        }
+
     def action_view_sprint_tasks(self):
         """
         JIRA-like sprint board.
@@ -261,7 +470,7 @@ class ProjectSprint(models.Model):
             "views": [
                 (
                     self.env.ref(
-                        "master_sprint_management.view_task_kanban"
+                        "master_sprint_management.view_task_kanban_sprint_board"
                     ).id,
                     "kanban",
                 ),
@@ -293,20 +502,523 @@ class ProjectSprint(models.Model):
 
         return action
 
+    # --------------------------------------------------
+    # SPRINT BOARD RPC
+    # --------------------------------------------------
+    def _get_board_domain(self):
+        self.ensure_one()
+        return [
+            ("project_id", "=", self.project_id.id),
+            ("sprint_id", "=", self.id),
+        ]
+
+    def get_board_header(self):
+        """
+        Sprint metadata, stage columns and per-stage card counts of the
+        board and story points per assignee, served once instead of being
+        repeated on every card, and the bus channel to ask for live card
+        updates (granted by the bus controller after an access check).
+        """
+        self.ensure_one()
+        stages = self.env["project.task.type"].search(
+            [
+                ("project_ids", "in", self.project_id.id),
+                ("use_in_sprint_board", "=", True),
+            ]
+        )
+        groups = self.env["project.task"].read_group(
+            self._get_board_domain(), ["stage_id"], ["stage_id"], lazy=False
+        )
+        counts = {g["stage_id"][0] if g["stage_id"] else False: g["__count"] for g in groups}
+
+        return {
+            "sprint": {
+                "id": self.id,
+                "name": self.name,
+                "goal": self.goal or "",
+                "state": self.state,
+                "start_date": self.start_date,
+                "end_date": self.end_date,
+                "project_id": self.project_id.id,
+                "project_name": self.project_id.name,
+                "capacity_points": self.capacity_points,
+                "committed_points": self.committed_points,
+                "done_points": self.done_points,
+            },
+            "assignees": self._read_assignee_load()[self.id],
+            "columns": [
+                {
+                    "stage_id": stage.id,
+                    "name": stage.name,
+                    "fold": stage.fold,
+                    "is_sprint_done": stage.is_sprint_done,
+                    "count": counts.get(stage.id, 0),
+                }
+                for stage in stages
+            ],
+            "total": sum(counts.values()),
+            "channel": BOARD_CHANNEL % self.id,
+        }
+
+    def get_board_delta(self, since=None, ids_hash=None, etag=None):
+        """
+        Board changes since a (since, ids_hash) cursor returned by a previous
+        call: cards created or changed, ids that left the board, and the new
+        cursor and ETag. A matching ETag short-circuits to `unchanged`.
+        Removals are derived from the sprint history; when they cannot be
+        reconciled with ids_hash (deleted tasks, no cursor) the full list of
+        board ids is returned in `ids` for the client to diff.
+        """
+        self.ensure_one()
+        Task = self.env["project.task"]
+        rows = Task.search_read(
+            self._get_board_domain(), ["write_date", "create_date"], order="id"
+        )
+        ids = [row["id"] for row in rows]
+        board_etag = hashlib.sha1(
+            ",".join("%s:%s" % (row["id"], row["write_date"].isoformat()) for row in rows).encode()
+        ).hexdigest()
+
+        # A malformed cursor is answered like no cursor: a full reload
+        try:
+            since_date = datetime.fromisoformat(since) if since else None
+        except (TypeError, ValueError):
+            since_date = None
+        if since_date and since_date.tzinfo:
+            since_date = None
+        last_write = max([row["write_date"] for row in rows] + [since_date or datetime.min])
+        result = {
+            "etag": board_etag,
+            "cursor": {
+                "since": last_write.isoformat(sep=" ") if rows or since_date else False,
+                "ids_hash": _hash_ids(ids),
+            },
+            "unchanged": etag == board_etag,
+            "changed": [],
+            "removed": [],
+            "ids": False,
+        }
+        if result["unchanged"]:
+            return result
+
+        if not since_date:
+            result["changed"] = Task.browse(ids).read(BOARD_CARD_FIELDS)
+            result["ids"] = ids
+            return result
+
+        window_start = since_date - BOARD_SYNC_OVERLAP
+        changed_ids = [row["id"] for row in rows if row["write_date"] > window_start]
+        result["changed"] = Task.browse(changed_ids).read(BOARD_CARD_FIELDS)
+
+        if ids_hash == result["cursor"]["ids_hash"]:
+            return result
+
+        entered = {row["id"] for row in rows if row["create_date"] > window_start}
+        left = set()
+        moves = self.env["project.task.sprint.history"].search(
+            [
+                ("date", ">", window_start),
+                "|",
+                ("from_sprint_id", "=", self.id),
+                ("to_sprint_id", "=", self.id),
+            ],
+            order="date, id",
+        )
+        for move in moves:
+            if move.to_sprint_id == self:
+                entered.add(move.task_id.id)
+            else:
+                left.add(move.task_id.id)
+
+        # What the client should hold if entries and removals explain the diff
+        previous = (set(ids) - entered) | left
+        if _hash_ids(previous) == ids_hash:
+            result["removed"] = sorted(left - set(ids))
+        else:
+            result["ids"] = ids
+        return result
+
     # --------------------------------------------------
     # BUSINESS METHODS
     # --------------------------------------------------
+    def _read_done_split(self):
+        """Return {sprint_id: (done, open, done_points, open_points)} counted by PostgreSQL"""
+        sprint_ids = [sid for sid in self._origin.ids if sid]
+        split = dict.fromkeys(sprint_ids, (0, 0, 0.0, 0.0))
+        if not sprint_ids:
+            return split
+
+        groups = self.env["project.task"].read_group(
+            [("sprint_id", "in", sprint_ids)],
+            ["sprint_id", "is_sprint_done", "story_points:sum"],
+            ["sprint_id", "is_sprint_done"],
+            lazy=False,
+        )
+        for group in groups:
+            sprint_id = group["sprint_id"][0]
+            done, open_, done_points, open_points = split[sprint_id]
+            if group["is_sprint_done"]:
+                done += group["__count"]
+                done_points += group["story_points"] or 0.0
+            else:
+                open_ += group["__count"]
+                open_points += group["story_points"] or 0.0
+            split[sprint_id] = (done, open_, done_points, open_points)
+        return split
+
+    def _read_assignee_load(self):
+        """
+        Return {sprint_id: [{user_id, name, task_count, points}]} from one
+        read_group over user_ids, heaviest assignee first. Unassigned tasks
+        are reported with user_id False.
+        """
+        sprint_ids = [sid for sid in self._origin.ids if sid]
+        load = {sid: [] for sid in sprint_ids}
+        if not sprint_ids:
+            return load
+
+        groups = self.env["project.task"].read_group(
+            [("sprint_id", "in", sprint_ids)],
+            ["sprint_id", "user_ids", "story_points:sum"],
+            ["sprint_id", "user_ids"],
+            lazy=False,
+        )
+        for group in groups:
+            user = group["user_ids"]
+            load[group["sprint_id"][0]].append({
+                "user_id": user and user[0],
+                "name": user[1] if user else _("Unassigned"),
+                "task_count": group["__count"],
+                "points": group["story_points"] or 0.0,
+            })
+        for lines in load.values():
+            lines.sort(key=lambda line: -line["points"])
+        return load
+
     def _compute_snapshot_values(self):
         self.ensure_one()
-        total = len(self.task_ids)
-        done = len(
-            self.task_ids.filtered(
-                lambda t: t.stage_id and (t.stage_id.is_closed or t.stage_id.fold)
-            )
-        )
+        done, open_, done_points, open_points = self._read_done_split()[self.id]
+        total = done + open_
         completion = round((done / total) * 100, 2) if total else 0.0
         return {
             "snapshot_task_count": total,
             "snapshot_done_count": done,
             "snapshot_completion_percentage": completion,
+            "snapshot_committed_points": done_points + open_points,
+            "snapshot_done_points": done_points,
         }
+
+    def _describe_carry_over_target(self, target_sprint):
+        if target_sprint:
+            return _("sprint <strong>%s</strong>") % escape(target_sprint.name)
+        return _("<strong>Backlog</strong>")
+
+    def _log_tasks_moved(self, tasks, target_sprint=False):
+        """
+        In the project's "task" sprint_close_log_mode, log a note on each
+        carried-over task, all in one batch instead of one message_post per
+        task. Nobody is notified here: see _post_carry_over_digest.
+        """
+        self.ensure_one()
+        if not tasks or self.project_id.sprint_close_log_mode != "task":
+            return
+
+        body = _(
+            "<p>Task moved from sprint <strong>%s</strong> to %s</p>"
+            "<p>Reason: Sprint closed with incomplete work.</p>"
+        ) % (escape(self.name), self._describe_carry_over_target(target_sprint))
+        tasks._message_log_batch({task.id: body for task in tasks})
+
+    def _post_carry_over_digest(self, tasks, target_sprint=False):
+        """One note on the sprint listing the carried-over tasks, notifying each assignee once"""
+        self.ensure_one()
+        if not tasks:
+            return
+
+        items = "".join("<li>%s</li>" % escape(name) for name in tasks.mapped("name"))
+        self.message_post(
+            body=_(
+                "<p>%d task(s) moved from sprint <strong>%s</strong> to %s</p>"
+                "<p>Reason: Sprint closed with incomplete work.</p>"
+                "<ul>%s</ul>"
+            )
+            % (len(tasks), escape(self.name), self._describe_carry_over_target(target_sprint), items),
+            subtype_xmlid="mail.mt_note",
+            partner_ids=tasks.mapped("user_ids.partner_id").ids,
+        )
+
+    def _move_incomplete_tasks(self, tasks, target_sprint):
+        """Carry tasks over to target_sprint, or to the backlog if it is empty"""
+        self.ensure_one()
+        if not tasks:
+            return
+
+        self._log_tasks_moved(tasks, target_sprint)
+        tasks = tasks.with_context(sprint_move_reason="carry_over")
+        if target_sprint:
+            tasks.write(
+                {
+                    "previous_sprint_id": self.id,
+                    "sprint_id": target_sprint.id,
+                }
+            )
+        else:
+            tasks.write({"sprint_id": False})
+
+    def _finish_close(self, moved_tasks, target_sprint, close_date):
+        """Close the sprint once all moved_tasks were carried over to target_sprint"""
+        self.ensure_one()
+        self.write({"state": "closed"})
+        self._post_carry_over_digest(moved_tasks, target_sprint)
+
+        self.message_post(
+            body=_(
+                "<p><strong>Sprint Closed Summary:</strong></p>"
+                "<ul>"
+                "<li>Total Tasks (Snapshot): %d</li>"
+                "<li>Done (Snapshot): %d</li>"
+                "<li>Incomplete at close: %d</li>"
+                "<li>Close Date: %s</li>"
+                "</ul>"
+            )
+            % (
+                self.snapshot_task_count,
+                self.snapshot_done_count,
+                len(moved_tasks),
+                close_date,
+            )
+        )
+
+    def _prepare_followup_values(self, start_date):
+        """Values of the sprint following this one, named after next month (e.g. 'Şubat 26')"""
+        self.ensure_one()
+        next_month = start_date.month % 12 + 1
+        next_year = start_date.year + (next_month == 1)
+        return {
+            "name": "%s %s" % (FOLLOWUP_MONTH_NAMES[next_month], str(next_year)[2:]),
+            "project_id": self.project_id.id,
+            "start_date": start_date,
+            "end_date": start_date + FOLLOWUP_SPRINT_LENGTH,
+            "state": "waiting",
+        }
+
+    # --------------------------------------------------
+    # AUTOMATIC ROLLOVER
+    # --------------------------------------------------
+    @api.model
+    @perf_logged()
+    def _cron_rollover_expired_sprints(self, auto_commit=True):
+        """
+        Close the active sprints past their end date in projects with a
+        sprint_rollover_policy, carrying incomplete tasks over as the policy
+        says. Sprints are found with one search and closed in batches; each
+        sprint closes in its own savepoint (and transaction with auto_commit)
+        so that a failing sprint does not block the others. Targets are
+        stored and committed before any sprint closes, so a run cut short
+        by a restart reuses them instead of creating more follow-ups.
+        """
+        batch_size = int(
+            self.env["ir.config_parameter"].sudo().get_param(
+                "master_sprint_management.rollover_batch_size", DEFAULT_ROLLOVER_BATCH_SIZE
+            )
+        )
+        expired = self.search(
+            [
+                ("state", "=", "active"),
+                ("end_date", "<", fields.Datetime.now()),
+                ("project_id.sprint_rollover_policy", "!=", "manual"),
+                "|",
+                ("close_job_id", "=", False),
+                ("close_job_id.state", "not in", ["pending", "running"]),
+            ],
+            order="end_date, id",
+        )
+        failed = []
+        for batch in split_every(batch_size, expired.ids, self.browse):
+            try:
+                with self.env.cr.savepoint():
+                    batch._prepare_rollover_targets()
+            except Exception:
+                # Each sprint prepares its own target below
+                _logger.exception("Preparing the rollover of sprints %s failed", batch.ids)
+            if auto_commit:
+                self.env.cr.commit()
+
+            for sprint in batch:
+                try:
+                    with self.env.cr.savepoint():
+                        sprint._prepare_rollover_targets()
+                        sprint._rollover(sprint.rollover_target_id)
+                except Exception:
+                    # The stored target is reused by the next run
+                    _logger.exception("Rollover of sprint %s failed", sprint.id)
+                    failed.append(sprint.id)
+                if auto_commit:
+                    self.env.cr.commit()
+
+        _logger.info("Sprint rollover: %d closed, %d failed", len(expired) - len(failed), len(failed))
+        return self.browse(failed)
+
+    def _prepare_rollover_targets(self):
+        """
+        Store on each expired sprint the sprint receiving its incomplete
+        tasks, per the project's policy (none = backlog). The next waiting
+        sprints are read with one search and the missing follow-ups are
+        created with one multi-record create. Sprints whose target was
+        already stored by an interrupted run keep it.
+        """
+        todo = self.filtered(
+            lambda s: s.project_id.sprint_rollover_policy in ("new", "existing")
+            and (not s.rollover_target_id or s.rollover_target_id.state == "closed")
+        )
+        if not todo:
+            return
+
+        next_waiting = {}
+        existing = todo.filtered(lambda s: s.project_id.sprint_rollover_policy == "existing")
+        if existing:
+            waiting = self.search(
+                [("project_id", "in", existing.project_id.ids), ("state", "=", "waiting")],
+                order="start_date desc, id desc",
+            )
+            for sprint in waiting:
+                next_waiting[sprint.project_id.id] = sprint  # earliest one wins
+
+        # Projects on "existing" with nothing planned fall back to a new sprint
+        to_create = todo.filtered(
+            lambda s: s.project_id.sprint_rollover_policy == "new"
+            or (s in existing and s.project_id.id not in next_waiting)
+        )
+        now = fields.Datetime.now()
+        created = self.create(
+            [
+                sprint._prepare_followup_values(
+                    sprint.end_date if sprint.end_date + FOLLOWUP_SPRINT_LENGTH > now else now
+                )
+                for sprint in to_create
+            ]
+        )
+        for sprint, target in zip(to_create, created):
+            sprint.rollover_target_id = target
+        for sprint in todo - to_create:
+            sprint.rollover_target_id = next_waiting[sprint.project_id.id]
+
+    def _rollover(self, target_sprint):
+        """Close this expired sprint at its end date and start target_sprint"""
+        self.ensure_one()
+        self.write(self._compute_snapshot_values())
+        incomplete_tasks = self.env["project.task"].search(
+            [
+                ("sprint_id", "=", self.id),
+                ("is_sprint_done", "=", False),
+            ]
+        )
+        with self.env["project.task"]._defer_sprint_recompute():
+            self._move_incomplete_tasks(incomplete_tasks, target_sprint)
+        self._finish_close(incomplete_tasks, target_sprint, self.end_date)
+        if target_sprint:
+            # At most one active sprint per project: close this one first
+            self.flush(["state"])
+            target_sprint.write({"state": "active"})
+
+    # --------------------------------------------------
+    # TASK COUNTERS
+    # --------------------------------------------------
+    def _apply_task_counter_delta(self, before, after):
+        """
+        Shift done/open counters and points by the difference between two
+        {sprint_id: [done, open, done_points, open_points]} states read
+        from project.task.
+        """
+        deltas = {}
+        for sign, state in ((-1, before), (1, after)):
+            for sprint_id, values in state.items():
+                delta = deltas.setdefault(sprint_id, [0, 0, 0.0, 0.0])
+                for i, value in enumerate(values):
+                    delta[i] += sign * value
+        deltas = {sid: d for sid, d in deltas.items() if any(d)}
+        if not deltas:
+            return
+
+        sprint_ids = list(deltas)
+        self.env.cr.execute(
+            """
+            UPDATE project_sprint sprint
+               SET done_count = sprint.done_count + delta.done,
+                   open_count = sprint.open_count + delta.open,
+                   completion_percentage = CASE
+                       WHEN sprint.done_count + delta.done + sprint.open_count + delta.open > 0
+                       THEN ROUND(100.0 * (sprint.done_count + delta.done)
+                                  / (sprint.done_count + delta.done + sprint.open_count + delta.open), 2)
+                       ELSE 0
+                   END,
+                   done_points = sprint.done_points + delta.done_points,
+                   committed_points = sprint.committed_points + delta.done_points + delta.open_points
+              FROM unnest(%s::int[], %s::int[], %s::int[], %s::float[], %s::float[])
+                   AS delta(id, done, open, done_points, open_points)
+             WHERE sprint.id = delta.id
+            """,
+            [
+                sprint_ids,
+                [deltas[sid][0] for sid in sprint_ids],
+                [deltas[sid][1] for sid in sprint_ids],
+                [deltas[sid][2] for sid in sprint_ids],
+                [deltas[sid][3] for sid in sprint_ids],
+            ],
+        )
+        self.browse(sprint_ids)._invalidate_task_counters()
+
+    def _rebuild_task_counters(self):
+        """Repair done/open counters and points of these sprints from project_task in bulk."""
+        if not self.ids:
+            return
+
+        self.env["project.task"].flush(["sprint_id", "is_sprint_done", "active", "story_points"])
+
+        self.env.cr.execute(
+            """
+            UPDATE project_sprint sprint
+               SET done_count = COALESCE(agg.done, 0),
+                   open_count = COALESCE(agg.total - agg.done, 0),
+                   completion_percentage = CASE
+                       WHEN COALESCE(agg.total, 0) > 0
+                       THEN ROUND(100.0 * agg.done / agg.total, 2)
+                       ELSE 0
+                   END,
+                   committed_points = COALESCE(agg.points, 0),
+                   done_points = COALESCE(agg.done_points, 0)
+              FROM project_sprint target
+         LEFT JOIN (
+                    SELECT sprint_id,
+                           COUNT(*) AS total,
+                           COUNT(*) FILTER (WHERE is_sprint_done) AS done,
+                           SUM(COALESCE(story_points, 0)) AS points,
+                           SUM(COALESCE(story_points, 0)) FILTER (WHERE is_sprint_done) AS done_points
+                      FROM project_task
+                     WHERE sprint_id = ANY(%s)
+                       AND active
+                  GROUP BY sprint_id
+                   ) agg ON agg.sprint_id = target.id
+             WHERE sprint.id = target.id
+               AND target.id = ANY(%s)
+            """,
+            [self.ids, self.ids],
+        )
+        self._invalidate_task_counters()
+
+    def _invalidate_task_counters(self):
+        self.invalidate_cache(
+            [
+                "done_count",
+                "open_count",
+                "completion_percentage",
+                "display_task_count",
+                "display_done_count",
+                "display_completion_percentage",
+                "committed_points",
+                "done_points",
+                "display_committed_points",
+                "display_done_points",
+            ],
+            self.ids,
+        )
@@ -0,0 +1,166 @@
+from odoo import api, fields, models
+import logging
+
+from .project_sprint_perf_log import perf_logged
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+class ProjectSprintCloseJob(models.Model):
+    """
+    Sprint close running outside the HTTP request.
+    The snapshot is written when the job is queued; the cron then moves the
+    frozen set of incomplete tasks in committed chunks and closes the sprint.
+    The sprint takes no new tasks meanwhile, and frozen tasks finished while
+    the job waits stay in it. Tasks already moved are no longer in the
+    sprint, so a job interrupted by a worker restart resumes where it
+    stopped.
+    """
+    _name = "project.sprint.close.job"
+    _description = "Sprint Close Job"
+    _order = "create_date desc, id desc"
+
+    sprint_id = fields.Many2one(
+        "project.sprint",
+        string="Sprint",
+        required=True,
+        readonly=True,
+        ondelete="cascade",
+        index=True,
+    )
+    project_id = fields.Many2one(
+        "project.project",
+        related="sprint_id.project_id",
+        store=True,
+    )
+    target_sprint_id = fields.Many2one(
+        "project.sprint",
+        string="Move To",
+        readonly=True,
+        help="Sprint receiving the incomplete tasks. Empty means backlog.",
+    )
+    close_date = fields.Datetime(
+        string="Close Date",
+        required=True,
+        readonly=True,
+    )
+    task_ids = fields.Many2many(
+        "project.task",
+        "project_sprint_close_job_task_rel",
+        "job_id",
+        "task_id",
+        string="Incomplete Tasks",
+        readonly=True,
+        help="Incomplete tasks when the close was requested.",
+    )
+    task_count = fields.Integer(string="Tasks to Move", readonly=True)
+    processed_count = fields.Integer(string="Moved", readonly=True, default=0)
+    progress = fields.Float(string="Progress", compute="_compute_progress")
+    state = fields.Selection(
+        [
+            ("pending", "Pending"),
+            ("running", "Running"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        string="Status",
+        default="pending",
+        required=True,
+        readonly=True,
+        index=True,
+    )
+    error_message = fields.Text(string="Error", readonly=True)
+
+    @api.depends("task_count", "processed_count")
+    def _compute_progress(self):
+        for job in self:
+            if job.state == "done":
+                job.progress = 100.0
+            elif job.task_count:
+                job.progress = round(job.processed_count / job.task_count * 100, 2)
+            else:
+                job.progress = 0.0
+
+    # --------------------------------------------------
+    # QUEUE
+    # --------------------------------------------------
+    @api.model
+    def _enqueue(self, sprint, tasks, target_sprint, close_date):
+        job = self.create({
+            "sprint_id": sprint.id,
+            "target_sprint_id": target_sprint.id,
+            "close_date": close_date,
+            "task_ids": [(6, 0, tasks.ids)],
+            "task_count": len(tasks),
+        })
+        sprint.close_job_id = job
+        self.env.ref("master_sprint_management.ir_cron_process_sprint_close_jobs")._trigger()
+        return job
+
+    def action_retry(self):
+        self.filtered(lambda j: j.state == "failed").write(
+            {"state": "pending", "error_message": False}
+        )
+        self.env.ref("master_sprint_management.ir_cron_process_sprint_close_jobs")._trigger()
+
+    # --------------------------------------------------
+    # CRON
+    # --------------------------------------------------
+    @api.model
+    def _cron_process_close_jobs(self, auto_commit=True):
+        chunk_size = int(
+            self.env["ir.config_parameter"].sudo().get_param(
+                "master_sprint_management.close_job_chunk_size", DEFAULT_CHUNK_SIZE
+            )
+        )
+        for job in self.search([("state", "in", ["pending", "running"])], order="id"):
+            try:
+                job._run(chunk_size, auto_commit)
+            except Exception as e:
+                if not auto_commit:
+                    raise
+                self.env.cr.rollback()
+                self.env.clear()
+                _logger.exception("Sprint close job %s failed", job.id)
+                job.write({"state": "failed", "error_message": str(e)})
+                self.env.cr.commit()
+
+    @perf_logged(touched=lambda job, *args, **kwargs: job.task_count)
+    def _run(self, chunk_size, auto_commit=True):
+        self.ensure_one()
+        sprint = self.sprint_id
+        self.state = "running"
+
+        while True:
+            tasks = self.env["project.task"].search(
+                [
+                    ("id", "in", self.task_ids.ids),
+                    ("sprint_id", "=", sprint.id),
+                    ("is_sprint_done", "=", False),
+                ],
+                limit=chunk_size,
+                order="id",
+            )
+            if not tasks:
+                break
+
+            with self.env["project.task"]._defer_sprint_recompute():
+                sprint._move_incomplete_tasks(tasks, self.target_sprint_id)
+            self.processed_count += len(tasks)
+            if auto_commit:
+                self.env.cr.commit()
+
+        # The frozen tasks now on the target, read back so that a restarted
+        # job still sends the whole digest
+        moved_tasks = self.env["project.task"].search(
+            [
+                ("id", "in", self.task_ids.ids),
+                ("sprint_id", "=", self.target_sprint_id.id or False),
+            ]
+        )
+        sprint._finish_close(moved_tasks, self.target_sprint_id, self.close_date)
+        self.state = "done"
+        if auto_commit:
+            self.env.cr.commit()
@@ -0,0 +1,116 @@
+from odoo import api, fields, models
+
+
+class ProjectSprintDailySnapshot(models.Model):
+    """
+    Append-only daily counters of active sprints, used by burndown and
+    burnup charts. Rows are written by a nightly cron with one INSERT.
+    """
+    _name = "project.sprint.daily.snapshot"
+    _description = "Sprint Daily Snapshot"
+    _order = "date, sprint_id"
+    _log_access = False
+
+    sprint_id = fields.Many2one(
+        "project.sprint",
+        string="Sprint",
+        required=True,
+        readonly=True,
+        ondelete="cascade",
+        index=True,
+    )
+    project_id = fields.Many2one(
+        "project.project",
+        string="Project",
+        readonly=True,
+        index=True,
+    )
+    date = fields.Date(string="Date", required=True, readonly=True, index=True)
+    total_count = fields.Integer(string="Total Tasks", readonly=True, group_operator="sum")
+    done_count = fields.Integer(string="Done Tasks", readonly=True, group_operator="sum")
+    remaining_count = fields.Integer(string="Remaining Tasks", readonly=True, group_operator="sum")
+    scope_added = fields.Integer(
+        string="Scope Added",
+        readonly=True,
+        group_operator="sum",
+        help="Tasks moved into the sprint since the previous snapshot (or the sprint start), "
+             "sprint planning excluded.",
+    )
+    scope_removed = fields.Integer(
+        string="Scope Removed",
+        readonly=True,
+        group_operator="sum",
+        help="Tasks moved out of the sprint since the previous snapshot (or the sprint start), "
+             "sprint planning excluded.",
+    )
+
+    _sql_constraints = [
+        (
+            "sprint_date_uniq",
+            "unique(sprint_id, date)",
+            "Only one snapshot per sprint and day is allowed.",
+        ),
+    ]
+
+    @api.model
+    def _cron_take_snapshots(self, date=None):
+        """
+        Snapshot every active sprint for `date` (default today).
+        Scope added/removed count the moves into and out of the sprint
+        recorded in project.task.sprint.history since the day after the
+        sprint's previous snapshot (or since the sprint start), up to `date`
+        included. Planning moves (the commitment picked in the sprint
+        wizards) are not scope changes. Already snapshotted days are left
+        as-is.
+        """
+        date = date or fields.Date.today()
+        self.env["project.task"].flush(["sprint_id", "is_sprint_done", "active"])
+        self.env["project.sprint"].flush(["state", "project_id"])
+
+        self.env.cr.execute(
+            """
+            INSERT INTO project_sprint_daily_snapshot
+                        (sprint_id, project_id, date, total_count, done_count,
+                         remaining_count, scope_added, scope_removed)
+                 SELECT sprint.id,
+                        sprint.project_id,
+                        %(date)s,
+                        COALESCE(agg.total, 0),
+                        COALESCE(agg.done, 0),
+                        COALESCE(agg.total, 0) - COALESCE(agg.done, 0),
+                        COALESCE(moves.added, 0),
+                        COALESCE(moves.removed, 0)
+                   FROM project_sprint sprint
+              LEFT JOIN (
+                         SELECT task.sprint_id,
+                                COUNT(*) AS total,
+                                COUNT(*) FILTER (WHERE task.is_sprint_done) AS done
+                           FROM project_task task
+                           JOIN project_sprint active_sprint
+                             ON active_sprint.id = task.sprint_id
+                            AND active_sprint.state = 'active'
+                          WHERE task.active
+                       GROUP BY task.sprint_id
+                        ) agg ON agg.sprint_id = sprint.id
+         LEFT JOIN LATERAL (
+                         SELECT snap.date
+                           FROM project_sprint_daily_snapshot snap
+                          WHERE snap.sprint_id = sprint.id
+                            AND snap.date < %(date)s
+                       ORDER BY snap.date DESC
+                          LIMIT 1
+                        ) prev ON TRUE
+         LEFT JOIN LATERAL (
+                         SELECT COUNT(*) FILTER (WHERE move.to_sprint_id = sprint.id) AS added,
+                                COUNT(*) FILTER (WHERE move.from_sprint_id = sprint.id) AS removed
+                           FROM project_task_sprint_history move
+                          WHERE (move.to_sprint_id = sprint.id OR move.from_sprint_id = sprint.id)
+                            AND move.reason != 'planning'
+                            AND move.date >= COALESCE(prev.date + 1, sprint.start_date)
+                            AND move.date < %(date)s::date + 1
+                        ) moves ON TRUE
+                  WHERE sprint.state = 'active'
+            ON CONFLICT (sprint_id, date) DO NOTHING
+            """,
+            {"date": date},
+        )
@@ -0,0 +1,265 @@
+import logging
+import random
+import time
+from datetime import timedelta
+
+from odoo import api, fields, models, _
+from odoo.exceptions import AccessError
+
+_logger = logging.getLogger(__name__)
+
+SPRINT_LENGTH = timedelta(weeks=2)
+
+
+class ProjectSprintLoadData(models.AbstractModel):
+    """
+    Deterministic volume data for benchmarking and profiling the module.
+    Projects, sprints and epics go through the ORM in multi-record creates;
+    tasks, carry-over history and chatter are inserted with INSERT ... SELECT
+    statements, then the stored counters are rebuilt in bulk. From a shell:
+
+        $ odoo-bin shell -d <db>
+        >>> env["project.sprint.load.data"]._generate(tasks=1000000, seed=42)
+        >>> env.cr.commit()
+    """
+    _name = "project.sprint.load.data"
+    _description = "Sprint Load Data Generator"
+
+    @api.model
+    def _generate(
+        self,
+        projects=200,
+        sprints=20,
+        tasks=100000,
+        epics=10,
+        closed_ratio=0.7,
+        backlog_percent=20,
+        carry_over_percent=10,
+        chatter_every=10,
+        seed=0,
+    ):
+        """
+        Create `projects` sprint-managed projects with `sprints` sprints each
+        (closed, one active, then waiting) and `tasks` tasks in total, spread
+        over sprints, backlog, stages and epics. The same seed always gives
+        the same data. Returns the created projects.
+        """
+        if not self.env.is_superuser():
+            raise AccessError(_("Only the superuser can generate load data."))
+
+        started = time.perf_counter()
+        rng = random.Random(seed)
+        self = self.with_context(tracking_disable=True, mail_notrack=True, mail_create_nolog=True)
+
+        project_recs = self.env["project.project"].create(
+            [
+                {"name": "Load %s-%04d" % (seed, i), "use_sprint_management": True}
+                for i in range(projects)
+            ]
+        )
+        sprint_recs = self._create_sprints(project_recs, sprints, closed_ratio)
+        epic_recs = self.env["project.epic"].create(
+            [
+                {"name": "%s / Epic %s" % (project.name, i), "project_id": project.id}
+                for project in project_recs
+                for i in range(epics)
+            ]
+        )
+        templates = self.env["project.task"].create(
+            [{"name": "%s / Task 0" % project.name, "project_id": project.id} for project in project_recs]
+        )
+        self.env["base"].flush()
+        _logger.info("Load data: %d projects, %d sprints created", len(project_recs), len(sprint_recs))
+
+        per_project, extra = divmod(tasks, projects)
+        for i, (project, template) in enumerate(zip(project_recs, templates)):
+            self._insert_tasks(
+                project,
+                template,
+                per_project + (i < extra) - 1,
+                sprint_recs.filtered(lambda s: s.project_id == project).sorted("start_date"),
+                epic_recs.filtered(lambda e: e.project_id == project),
+                {
+                    "seed": rng.randrange(1 << 30),
+                    "backlog_percent": backlog_percent,
+                    "carry_over_percent": carry_over_percent,
+                },
+            )
+        _logger.info("Load data: %d tasks inserted", tasks)
+
+        self._insert_history_and_chatter(project_recs, chatter_every)
+        self._rebuild_counters(project_recs, sprint_recs, epic_recs)
+        _logger.info("Load data generated in %.1fs", time.perf_counter() - started)
+        return project_recs
+
+    def _create_sprints(self, projects, count, closed_ratio):
+        """Two-week sprints per project; the one spanning today is active"""
+        closed = min(int(count * closed_ratio), count - 1)
+        today = fields.Datetime.now()
+        return self.env["project.sprint"].create(
+            [
+                {
+                    "name": "%s / Sprint %s" % (project.name, i + 1),
+                    "project_id": project.id,
+                    "start_date": today + (i - closed) * SPRINT_LENGTH,
+                    "end_date": today + (i - closed + 1) * SPRINT_LENGTH,
+                    "state": "closed" if i < closed else "active" if i == closed else "waiting",
+                }
+                for project in projects
+                for i in range(count)
+            ]
+        )
+
+    def _insert_tasks(self, project, template, count, sprints, epics, params):
+        """
+        Copy the template task `count` times. Each copy derives its sprint,
+        stage, epic and carry-over from its series number, so the rows only
+        depend on the seed. Tasks left in closed sprints are done; carried
+        over tasks point to the closed sprint before theirs.
+        """
+        if count <= 0:
+            return
+        stages = project.type_ids.sorted("sequence")
+        params = dict(
+            params,
+            template_id=template.id,
+            count=count,
+            sprint_ids=sprints.ids,
+            sprint_states=sprints.mapped("state"),
+            open_stage_ids=stages.filtered(lambda s: not s.is_sprint_done).ids or stages.ids,
+            done_stage_id=stages.filtered("is_sprint_done")[-1:].id or stages[-1:].id,
+            epic_ids=epics.ids or [None],
+        )
+        overrides = {
+            "name": "%(name_prefix)s || g",
+            "sequence": "g",
+            "sprint_id": "(%(sprint_ids)s::int[])[roll.sprint_pos]",
+            "sprint_state": "COALESCE((%(sprint_states)s::varchar[])[roll.sprint_pos], 'backlog')",
+            "previous_sprint_id": "CASE WHEN roll.carried THEN (%(sprint_ids)s::int[])[roll.sprint_pos - 1] END",
+            "stage_id": "CASE WHEN roll.done THEN %(done_stage_id)s "
+                        "ELSE (%(open_stage_ids)s::int[])[1 + roll.pick %% cardinality(%(open_stage_ids)s::int[])] END",
+            "is_sprint_done": "roll.done",
+            "epic_id": "(%(epic_ids)s::int[])[1 + roll.pick %% cardinality(%(epic_ids)s::int[])]",
+            "backlog_rank": "NULL",
+            "story_points": "(ARRAY[1, 2, 3, 5, 8, 13])[1 + roll.pick %% 6]",
+        }
+        params["name_prefix"] = "%s / Task " % project.name
+
+        self.env.cr.execute(
+            """
+            SELECT column_name
+              FROM information_schema.columns
+             WHERE table_name = 'project_task' AND column_name != 'id'
+          ORDER BY ordinal_position
+            """
+        )
+        columns = [row[0] for row in self.env.cr.fetchall()]
+        values = [overrides.get(column, "t.%s" % column) for column in columns]
+        # roll: sprint position (NULL = backlog), done/carried flags and a
+        # pseudo-random pick, all hashed from g and the project seed
+        self.env.cr.execute(
+            """
+            INSERT INTO project_task ({columns})
+                 SELECT {values}
+                   FROM project_task t,
+                        (SELECT g, sprint_pos, pick,
+                                sprint_pos IS NOT NULL
+                                    AND ((%(sprint_states)s::varchar[])[sprint_pos] = 'closed' OR pick %% 100 < 25)
+                                    AS done,
+                                sprint_pos > 1
+                                    AND (%(sprint_states)s::varchar[])[sprint_pos] != 'closed'
+                                    AND (%(sprint_states)s::varchar[])[sprint_pos - 1] = 'closed'
+                                    AND pick %% 100 >= 100 - %(carry_over_percent)s
+                                    AS carried
+                           FROM (SELECT g,
+                                        CASE WHEN (g * 7919 + %(seed)s) %% 100 >= %(backlog_percent)s
+                                             THEN 1 + (g * 104729 + %(seed)s) %% cardinality(%(sprint_ids)s::int[])
+                                        END AS sprint_pos,
+                                        (g * 15485863 + %(seed)s) %% 1000003 AS pick
+                                   FROM generate_series(1, %(count)s) g) hashed
+                        ) roll
+                  WHERE t.id = %(template_id)s
+            """.format(columns=", ".join(columns), values=", ".join(values)),
+            params,
+        )
+
+    def _insert_history_and_chatter(self, projects, chatter_every):
+        self.env.cr.execute(
+            """
+            INSERT INTO project_task_sprint_history
+                        (task_id, project_id, from_sprint_id, to_sprint_id, reason, date)
+                 SELECT task.id, task.project_id, task.previous_sprint_id, task.sprint_id,
+                        'carry_over', sprint.end_date
+                   FROM project_task task
+                   JOIN project_sprint sprint ON sprint.id = task.previous_sprint_id
+                  WHERE task.project_id = ANY(%s)
+            """,
+            [projects.ids],
+        )
+        if not chatter_every:
+            return
+        author = self.env.user.partner_id
+        self.env.cr.execute(
+            """
+            INSERT INTO mail_message
+                        (model, res_id, record_name, body, message_type, subtype_id,
+                         author_id, email_from, date, create_uid, create_date, write_uid, write_date)
+                 SELECT 'project.task', task.id, task.name, %s, 'comment', %s,
+                        %s, %s, task.create_date, %s, task.create_date, %s, task.create_date
+                   FROM project_task task
+                  WHERE task.project_id = ANY(%s)
+                    AND task.id %% %s = 0
+            """,
+            [
+                "<p>Generated load data note.</p>",
+                self.env["ir.model.data"]._xmlid_to_res_id("mail.mt_note"),
+                author.id,
+                author.email_formatted,
+                self.env.uid,
+                self.env.uid,
+                projects.ids,
+                chatter_every,
+            ],
+        )
+
+    def _rebuild_counters(self, projects, sprints, epics):
+        """Bring every stored value derived from the raw rows up to date"""
+        self.env["base"].invalidate_cache()
+        projects._rebalance_backlog_ranks()
+        sprints._rebuild_task_counters()
+
+        closed = sprints.filtered(lambda s: s.state == "closed")
+        if closed:
+            # What the close wizard would have frozen: done + carried over
+            self.env.cr.execute(
+                """
+                UPDATE project_sprint sprint
+                   SET snapshot_task_count = sprint.done_count + COALESCE(carried.total, 0),
+                       snapshot_done_count = sprint.done_count,
+                       snapshot_completion_percentage = CASE
+                           WHEN sprint.done_count + COALESCE(carried.total, 0) > 0
+                           THEN ROUND(100.0 * sprint.done_count
+                                      / (sprint.done_count + COALESCE(carried.total, 0)), 2)
+                           ELSE 0
+                       END
+                  FROM project_sprint target
+             LEFT JOIN (
+                        SELECT previous_sprint_id, COUNT(*) AS total
+                          FROM project_task
+                         WHERE previous_sprint_id = ANY(%s)
+                      GROUP BY previous_sprint_id
+                       ) carried ON carried.previous_sprint_id = target.id
+                 WHERE sprint.id = target.id
+                   AND target.id = ANY(%s)
+                """,
+                [closed.ids, closed.ids],
+            )
+            closed._invalidate_task_counters()
+
+        for records, fname in [
+            (sprints, "task_count"),
+            (projects, "backlog_task_count"),
+            (epics, "task_count"),
+        ]:
+            self.env.add_to_compute(records._fields[fname], records)
+        self.env["base"].flush()
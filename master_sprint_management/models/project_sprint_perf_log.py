@@ -0,0 +1,80 @@
+import functools
+import logging
+import threading
+import time
+
+from odoo import fields, models
+
+_logger = logging.getLogger(__name__)
+
+PERF_LOG_PARAM = "master_sprint_management.perf_log"
+
+
+def perf_logged(touched=None):
+    """
+    Record the wall time, SQL queries and SQL time of a method in
+    project.sprint.perf.log when the perf_log system parameter is set.
+    `touched` maps the call arguments to the number of records the call
+    works on (default: len(self)). Disabled, the wrapper costs one cached
+    parameter lookup.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.env["ir.config_parameter"].sudo().get_param(PERF_LOG_PARAM):
+                return method(self, *args, **kwargs)
+
+            record_count = touched(self, *args, **kwargs) if touched else len(self)
+            thread = threading.current_thread()
+            if not hasattr(thread, "query_time"):
+                # Only HTTP workers get these from the server; sql_db adds to them
+                thread.query_count = 0
+                thread.query_time = 0
+            queries = self.env.cr.sql_log_count
+            query_time = thread.query_time
+            start = time.perf_counter()
+            result = method(self, *args, **kwargs)
+            self.env["project.sprint.perf.log"]._record(
+                "%s.%s" % (self._name, method.__name__),
+                time.perf_counter() - start,
+                self.env.cr.sql_log_count - queries,
+                thread.query_time - query_time,
+                record_count,
+            )
+            return result
+        return wrapper
+    return decorator
+
+
+class ProjectSprintPerfLog(models.Model):
+    """
+    Timing of instrumented sprint actions and computes, one row per call.
+    Rows are inserted with raw SQL so that logging is safe inside computes
+    and adds a single query to the measured transaction.
+    """
+    _name = "project.sprint.perf.log"
+    _description = "Sprint Performance Log"
+    _order = "duration desc, id desc"
+    _log_access = False
+
+    name = fields.Char(string="Method", required=True, readonly=True, index=True)
+    date = fields.Datetime(string="Date", required=True, readonly=True)
+    user_id = fields.Many2one("res.users", string="User", readonly=True)
+    duration = fields.Float(string="Duration (ms)", readonly=True, group_operator="max")
+    query_count = fields.Integer(string="Queries", readonly=True)
+    query_time = fields.Float(string="SQL Time (ms)", readonly=True, group_operator="max")
+    record_count = fields.Integer(string="Records", readonly=True)
+
+    def _record(self, name, duration, query_count, query_time, record_count):
+        _logger.info(
+            "%s: %.1f ms, %d queries (%.1f ms SQL), %d records",
+            name, duration * 1000, query_count, query_time * 1000, record_count,
+        )
+        self.env.cr.execute(
+            """
+            INSERT INTO project_sprint_perf_log
+                        (name, date, user_id, duration, query_count, query_time, record_count)
+                 VALUES (%s, NOW() AT TIME ZONE 'UTC', %s, %s, %s, %s, %s)
+            """,
+            [name, self.env.uid, duration * 1000, query_count, query_time * 1000, record_count],
+        )
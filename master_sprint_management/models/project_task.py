@@ -1,4 +1,33 @@
-from odoo import api, fields, models
+from contextlib import contextmanager
+
+from odoo import api, fields, models, tools, _
+from odoo.exceptions import UserError
+from odoo.tools import split_every
+
+from .backlog_rank import longest_increasing, rank_after, rank_between
+from .project_sprint_perf_log import perf_logged
+
+# Fields that move a task between sprint done/open counters. project_id is
+# one of them: the stage (and so is_sprint_done) is computed from it.
+SPRINT_COUNTER_FIELDS = {"sprint_id", "stage_id", "project_id", "active", "story_points"}
+
+DEFAULT_MOVE_CHUNK_SIZE = 1000
+
+# Stored counters recomputed once at the end of a deferred bulk operation
+DEFERRED_RECOMPUTE_FIELDS = [
+    ("project.sprint", "task_count"),
+    ("project.project", "backlog_task_count"),
+    ("project.epic", "task_count"),
+]
+DEFERRED_RECOMPUTE_KEY = "master_sprint_management.deferred_recompute"
+
+# Fields whose change is pushed to open sprint boards over the bus
+BOARD_NOTIFY_FIELDS = {"sprint_id", "stage_id", "backlog_rank"}
+BOARD_NOTIFY_KEY = "master_sprint_management.board_notifications"
+# Channel a board asks the bus for; the bus controller swaps it for the
+# sprint's record channel after an access check. Clients can only subscribe
+# to string channels, so they cannot listen to a sprint they cannot read.
+BOARD_CHANNEL = "master_sprint_management.sprint_board_%s"
 
 
 class ProjectTask(models.Model):
@@ -8,6 +37,7 @@ class ProjectTask(models.Model):
         "project.sprint",
         string="Sprint",
         ondelete="set null",
+        index=True,
         domain="[('project_id', '=', project_id), ('state', 'in', ['waiting','active'])]",
     )
 
@@ -15,6 +45,7 @@ class ProjectTask(models.Model):
         "project.epic",
         string="Epic",
         ondelete="set null",
+        index=True,
         domain="[('project_id', '=', project_id)]",
     )
 
@@ -22,9 +53,44 @@ class ProjectTask(models.Model):
         "project.sprint",
         string="Previous Sprint",
         readonly=True,
+        index=True,
         help="Sprint this task was moved from",
     )
 
+    is_sprint_done = fields.Boolean(
+        related="stage_id.is_sprint_done",
+        string="Done in Sprint",
+        store=True,
+        index=True,
+    )
+
+    # Denormalized sprint state: plain column filter for backlog domains
+    sprint_state = fields.Selection(
+        [
+            ("backlog", "Backlog"),
+            ("waiting", "Waiting"),
+            ("active", "Active"),
+            ("closed", "Closed"),
+        ],
+        string="Sprint Status",
+        compute="_compute_sprint_state",
+        store=True,
+        index=True,
+    )
+
+    backlog_rank = fields.Char(
+        string="Backlog Rank",
+        index=True,
+        copy=False,
+        help="Lexicographic position in the backlog and on the sprint board",
+    )
+
+    story_points = fields.Float(
+        string="Story Points",
+        default=0.0,
+        help="Relative size of the task, summed into the committed and done points of its sprint",
+    )
+
     # BANNER HELPERS (Non-stored related for UI)
     sprint_goal = fields.Text(related="sprint_id.goal", string="Sprint Goal")
     sprint_start_date = fields.Datetime(related="sprint_id.start_date")
@@ -37,6 +103,384 @@ class ProjectTask(models.Model):
         readonly=True,
     )
 
+    @api.depends("sprint_id", "sprint_id.state")
+    def _compute_sprint_state(self):
+        for task in self:
+            task.sprint_state = task.sprint_id.state or "backlog"
+
+    def init(self):
+        super().init()
+        # Planning view: open sprint tasks and backlog of one project
+        tools.create_index(
+            self.env.cr, "project_task_project_sprint_state_idx", self._table, ["project_id", "sprint_state"]
+        )
+        # Rank neighbour lookups within a project
+        tools.create_index(
+            self.env.cr, "project_task_project_backlog_rank_idx", self._table, ["project_id", "backlog_rank"]
+        )
+        # Backlog lookups: tasks of a project without sprint
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS project_task_backlog_idx
+                ON project_task (project_id)
+             WHERE sprint_id IS NULL
+            """
+        )
+
+    # --------------------------------------------------
+    # ORM OVERRIDES
+    # --------------------------------------------------
+    @api.model_create_multi
+    def create(self, vals_list):
+        self._check_sprint_not_closing(
+            vals.get("sprint_id", self.env.context.get("default_sprint_id")) for vals in vals_list
+        )
+        self._assign_backlog_ranks(vals_list)
+        tasks = super().create(vals_list)
+        self.env["project.sprint"]._apply_task_counter_delta(
+            {}, tasks._read_sprint_counter_state()
+        )
+        self.env["project.task.sprint.history"]._log_moves(
+            [
+                (task.id, task.project_id.id or None, None, task.sprint_id.id)
+                for task in tasks
+                if task.sprint_id
+            ],
+            "created",
+        )
+        self._collect_deferred_recompute()
+        return tasks
+
+    def write(self, vals):
+        if vals.get("sprint_id"):
+            self._check_sprint_not_closing([vals["sprint_id"]])
+        old_sprints = self._read_sprint_assignments() if "sprint_id" in vals else {}
+
+        if not SPRINT_COUNTER_FIELDS.intersection(vals):
+            res = super().write(vals)
+        else:
+            before = self._read_sprint_counter_state()
+            res = super().write(vals)
+            self.env["project.sprint"]._apply_task_counter_delta(
+                before, self._read_sprint_counter_state()
+            )
+
+        if old_sprints:
+            new_sprint_id = vals["sprint_id"] or None
+            self.env["project.task.sprint.history"]._log_moves(
+                [
+                    (task_id, vals.get("project_id", project_id) or None, sprint_id, new_sprint_id)
+                    for task_id, (project_id, sprint_id) in old_sprints.items()
+                    if sprint_id != new_sprint_id
+                ],
+                self.env.context.get("sprint_move_reason", "manual"),
+            )
+        if BOARD_NOTIFY_FIELDS.intersection(vals):
+            self._queue_board_notifications(old_sprints)
+        self._collect_deferred_recompute()
+        return res
+
+    @api.model
+    def _check_sprint_not_closing(self, sprint_ids):
+        """A sprint closed by a background job takes no new tasks"""
+        sprints = self.env["project.sprint"].browse({sid for sid in sprint_ids if sid})
+        closing = sprints.filtered(lambda s: s.close_job_state in ("pending", "running"))
+        if closing:
+            raise UserError(
+                _('Sprint "%s" is being closed in the background and cannot take new tasks.')
+                % closing[0].name
+            )
+
+    def _read_sprint_assignments(self):
+        """Return {task_id: (project_id, sprint_id)} straight from the database"""
+        task_ids = [tid for tid in self.ids if tid]
+        if not task_ids:
+            return {}
+        self.flush(["project_id", "sprint_id"])
+        self.env.cr.execute(
+            "SELECT id, project_id, sprint_id FROM project_task WHERE id = ANY(%s)",
+            [task_ids],
+        )
+        return {task_id: (project_id, sprint_id) for task_id, project_id, sprint_id in self.env.cr.fetchall()}
+
+    def unlink(self):
+        before = self._read_sprint_counter_state()
+        res = super().unlink()
+        self.env["project.sprint"]._apply_task_counter_delta(before, {})
+        self._collect_deferred_recompute()
+        return res
+
+    # --------------------------------------------------
+    # DEFERRED RECOMPUTE
+    # --------------------------------------------------
+    @contextmanager
+    def _defer_sprint_recompute(self):
+        """
+        Defer the sprint/project/epic task counters during a bulk operation:
+        records marked for recompute are collected and recomputed once, with
+        grouped queries, when the outermost block exits.
+
+            with self.env["project.task"]._defer_sprint_recompute():
+                tasks.write({"sprint_id": sprint.id})
+
+        Scripts may instead pass the defer_sprint_recompute context key; the
+        counters are then recomputed right before the transaction commits.
+        """
+        data = self.env.cr.precommit.data
+        depth_key = DEFERRED_RECOMPUTE_KEY + ".depth"
+        data[depth_key] = data.get(depth_key, 0) + 1
+        try:
+            yield
+        finally:
+            data[depth_key] -= 1
+        if not data[depth_key]:
+            self._run_deferred_recompute()
+
+    def _collect_deferred_recompute(self):
+        data = self.env.cr.precommit.data
+        in_block = data.get(DEFERRED_RECOMPUTE_KEY + ".depth")
+        if not (in_block or self.env.context.get("defer_sprint_recompute")):
+            return
+
+        if DEFERRED_RECOMPUTE_KEY not in data:
+            data[DEFERRED_RECOMPUTE_KEY] = {}
+            if not in_block:
+                self.env.cr.precommit.add(self._run_deferred_recompute)
+
+        pending = data[DEFERRED_RECOMPUTE_KEY]
+        for model_name, fname in DEFERRED_RECOMPUTE_FIELDS:
+            field = self.env[model_name]._fields[fname]
+            records = self.env.records_to_compute(field)
+            if records:
+                pending.setdefault(field, set()).update(records.ids)
+                self.env.remove_to_compute(field, records)
+
+    @api.model
+    def _run_deferred_recompute(self):
+        pending = self.env.cr.precommit.data.pop(DEFERRED_RECOMPUTE_KEY, {})
+        for field, ids in pending.items():
+            records = self.env[field.model_name].browse(ids).exists()
+            self.env.add_to_compute(field, records)
+        for model_name, fname in DEFERRED_RECOMPUTE_FIELDS:
+            self.env[model_name].flush([fname])
+
+    # --------------------------------------------------
+    # BOARD NOTIFICATIONS
+    # --------------------------------------------------
+    def _queue_board_notifications(self, old_sprints):
+        """
+        Remember the tasks changed in this transaction with the sprint they
+        were on before it; one notification per board is sent at commit.
+        """
+        data = self.env.cr.precommit.data
+        if BOARD_NOTIFY_KEY not in data:
+            data[BOARD_NOTIFY_KEY] = {}
+            self.env.cr.precommit.add(self._send_board_notifications)
+
+        pending = data[BOARD_NOTIFY_KEY]
+        for task in self:
+            if task.id in pending:
+                continue
+            if task.id in old_sprints:
+                pending[task.id] = old_sprints[task.id][1]
+            else:
+                pending[task.id] = task.sprint_id.id
+
+    @api.model
+    def _send_board_notifications(self):
+        pending = self.env.cr.precommit.data.pop(BOARD_NOTIFY_KEY, {})
+        updates = {}
+        for task in self.browse(pending).exists():
+            payload = {
+                "id": task.id,
+                "stage_id": task.stage_id.id,
+                "sprint_id": task.sprint_id.id,
+                "backlog_rank": task.backlog_rank,
+            }
+            # The sprint the task left must drop the card too
+            for sprint_id in {pending[task.id], task.sprint_id.id}:
+                if sprint_id:
+                    updates.setdefault(sprint_id, []).append(payload)
+
+        if updates:
+            sprints = self.env["project.sprint"]
+            self.env["bus.bus"]._sendmany(
+                [
+                    (sprints.browse(sprint_id), "sprint_board/tasks", {"sprint_id": sprint_id, "tasks": tasks})
+                    for sprint_id, tasks in updates.items()
+                ]
+            )
+
+    # --------------------------------------------------
+    # BULK MOVE API
+    # --------------------------------------------------
+    @api.model
+    def _read_project_groups(self, task_ids):
+        """Return {project_id: task count} for task_ids in one grouped query"""
+        groups = self.read_group(
+            [("id", "in", list(task_ids))],
+            ["project_id"],
+            ["project_id"],
+            lazy=False,
+        )
+        return {
+            g["project_id"][0] if g["project_id"] else False: g["__count"]
+            for g in groups
+        }
+
+    @api.model
+    @perf_logged(touched=lambda tasks, task_ids, *args, **kwargs: len(task_ids))
+    def move_tasks_to_sprint(self, task_ids, sprint_id, chunk_size=None):
+        """
+        Move many tasks to a sprint (False = backlog) for integrations.
+        Project membership is checked with one grouped query, tasks are
+        written in chunks and the sprint/project counters are recomputed
+        once at the end.
+        Returns move statistics.
+        """
+        task_ids = list(task_ids)
+        sprint = self.env["project.sprint"].browse(sprint_id)
+        if sprint and sprint.state == "closed":
+            raise UserError(_('Tasks cannot be moved to the closed sprint "%s".') % sprint.name)
+
+        projects = self._read_project_groups(task_ids)
+        if len(projects) > 1 or (sprint and projects and sprint.project_id.id not in projects):
+            raise UserError(_("All tasks must belong to the project of the target sprint."))
+
+        to_move = self.search(
+            [("id", "in", task_ids), ("sprint_id", "!=", sprint.id or False)]
+        )
+        chunk_size = chunk_size or int(
+            self.env["ir.config_parameter"].sudo().get_param(
+                "master_sprint_management.move_chunk_size", DEFAULT_MOVE_CHUNK_SIZE
+            )
+        )
+        chunks = 0
+        tasks = self.with_context(sprint_move_reason="bulk_move")
+        with self._defer_sprint_recompute():
+            for chunk in split_every(chunk_size, to_move.ids, tasks.browse):
+                chunk.write({"sprint_id": sprint.id or False})
+                chunks += 1
+
+        return {
+            "sprint_id": sprint.id or False,
+            "requested": len(task_ids),
+            "found": sum(projects.values()),
+            "moved": len(to_move),
+            "unchanged": sum(projects.values()) - len(to_move),
+            "chunks": chunks,
+        }
+
+    # --------------------------------------------------
+    # BACKLOG RANK
+    # --------------------------------------------------
+    @api.model
+    def _assign_backlog_ranks(self, vals_list):
+        """Append new tasks at the bottom of their project's backlog"""
+        default_project_id = self.env.context.get("default_project_id")
+        unranked = [vals for vals in vals_list if not vals.get("backlog_rank")]
+        project_ids = {vals.get("project_id", default_project_id) or None for vals in unranked}
+        if not project_ids:
+            return
+
+        last_ranks = self._read_last_backlog_ranks([pid for pid in project_ids if pid])
+        for vals in unranked:
+            project_id = vals.get("project_id", default_project_id) or None
+            last_ranks[project_id] = vals["backlog_rank"] = rank_after(last_ranks.get(project_id))
+
+    @api.model
+    def _read_last_backlog_ranks(self, project_ids):
+        if not project_ids:
+            return {}
+        self.flush(["project_id", "backlog_rank"])
+        self.env.cr.execute(
+            """
+            SELECT project_id, MAX(backlog_rank)
+              FROM project_task
+             WHERE project_id = ANY(%s)
+          GROUP BY project_id
+            """,
+            [project_ids],
+        )
+        return dict(self.env.cr.fetchall())
+
+    def _read_neighbour_rank(self, rank, after=False):
+        """Closest rank before (or after) `rank` within this task's project"""
+        self.ensure_one()
+        self.flush(["project_id", "backlog_rank"])
+        self.env.cr.execute(
+            """
+            SELECT %s(backlog_rank)
+              FROM project_task
+             WHERE project_id IS NOT DISTINCT FROM %%s
+               AND backlog_rank %s %%s
+            """
+            % (("MIN", ">") if after else ("MAX", "<")),
+            [self.project_id.id or None, rank],
+        )
+        return self.env.cr.fetchone()[0]
+
+    def _resequence_backlog_rank(self):
+        """
+        Give the tasks of self ranks following the recordset order.
+        Only tasks outside the longest already-ordered run are written,
+        so dragging one task writes one row.
+        """
+        tasks = self.exists()
+        keys = tasks.mapped("backlog_rank")
+        keep = longest_increasing(keys)
+        if len(keep) == len(tasks):
+            return
+
+        for i, task in enumerate(tasks):
+            if i in keep:
+                continue
+            upper = next((keys[j] for j in range(i + 1, len(tasks)) if j in keep), None)
+            if i:
+                lower = keys[i - 1]
+            elif upper:
+                lower = task._read_neighbour_rank(upper)
+            else:
+                lower = self._read_last_backlog_ranks(task.project_id.ids).get(task.project_id.id)
+            if upper is None and lower:
+                upper = task._read_neighbour_rank(lower, after=True)
+
+            if lower and upper and lower >= upper:
+                # Concurrent appends produced duplicate keys: respace the project
+                task.project_id._rebalance_backlog_ranks()
+                return tasks._resequence_backlog_rank()
+
+            keys[i] = rank_between(lower, upper)
+            task.backlog_rank = keys[i]
+
+    # --------------------------------------------------
+    # SPRINT COUNTERS
+    # --------------------------------------------------
+    def _read_sprint_counter_state(self):
+        """Return {sprint_id: [done, open, done_points, open_points]} for the active tasks in self."""
+        task_ids = [tid for tid in self.ids if tid]
+        if not task_ids:
+            return {}
+
+        self.flush(["sprint_id", "is_sprint_done", "active", "story_points"])
+
+        self.env.cr.execute(
+            """
+            SELECT sprint_id,
+                   COUNT(*) FILTER (WHERE is_sprint_done),
+                   COUNT(*) FILTER (WHERE is_sprint_done IS NOT TRUE),
+                   COALESCE(SUM(story_points) FILTER (WHERE is_sprint_done), 0),
+                   COALESCE(SUM(story_points) FILTER (WHERE is_sprint_done IS NOT TRUE), 0)
+              FROM project_task
+             WHERE id = ANY(%s)
+               AND sprint_id IS NOT NULL
+               AND active
+          GROUP BY sprint_id
+            """,
+            [task_ids],
+        )
+        return {sprint_id: list(counters) for sprint_id, *counters in self.env.cr.fetchall()}
+
     # --------------------------------------------------
     # ACTIONS FOR SPRINT BOARD
     # --------------------------------------------------
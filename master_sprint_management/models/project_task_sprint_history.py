@@ -0,0 +1,73 @@
+from odoo import api, fields, models
+
+
+class ProjectTaskSprintHistory(models.Model):
+    """
+    Append-only log of sprint assignment changes, one narrow row per task
+    move. Rows are inserted in bulk by project.task create/write.
+    """
+    _name = "project.task.sprint.history"
+    _description = "Task Sprint History"
+    _order = "date desc, id desc"
+    _log_access = False
+
+    task_id = fields.Many2one(
+        "project.task",
+        string="Task",
+        required=True,
+        readonly=True,
+        ondelete="cascade",
+        index=True,
+    )
+    project_id = fields.Many2one(
+        "project.project",
+        string="Project",
+        readonly=True,
+        index=True,
+    )
+    from_sprint_id = fields.Many2one(
+        "project.sprint",
+        string="From Sprint",
+        readonly=True,
+        ondelete="set null",
+        index=True,
+    )
+    to_sprint_id = fields.Many2one(
+        "project.sprint",
+        string="To Sprint",
+        readonly=True,
+        ondelete="set null",
+        index=True,
+    )
+    reason = fields.Selection(
+        [
+            ("created", "Created"),
+            ("manual", "Manual"),
+            ("planning", "Sprint Planning"),
+            ("bulk_move", "Bulk Move"),
+            ("carry_over", "Carry-over"),
+        ],
+        string="Reason",
+        required=True,
+        readonly=True,
+        index=True,
+    )
+    date = fields.Datetime(string="Date", required=True, readonly=True)
+
+    @api.model
+    def _log_moves(self, moves, reason):
+        """Insert (task_id, project_id, from_sprint_id, to_sprint_id) rows in one statement"""
+        if not moves:
+            return
+        task_ids, project_ids, from_ids, to_ids = zip(*moves)
+        self.env.cr.execute(
+            """
+            INSERT INTO project_task_sprint_history
+                        (task_id, project_id, from_sprint_id, to_sprint_id, reason, date)
+                 SELECT move.task_id, move.project_id, move.from_sprint_id, move.to_sprint_id,
+                        %s, NOW() AT TIME ZONE 'UTC'
+                   FROM unnest(%s::int[], %s::int[], %s::int[], %s::int[])
+                        AS move(task_id, project_id, from_sprint_id, to_sprint_id)
+            """,
+            [reason, list(task_ids), list(project_ids), list(from_ids), list(to_ids)],
+        )
@@ -1,4 +1,4 @@
-from odoo import fields, models
+from odoo import api, fields, models
 
 
 class ProjectTaskType(models.Model):
@@ -9,3 +9,36 @@ class ProjectTaskType(models.Model):
         default=True,
         help="If enabled, this stage will appear in Sprint Board kanban"
     )
+
+    is_sprint_template = fields.Boolean(
+        string="Shared Sprint Stage",
+        default=False,
+        help="Stage linked to new sprint-managed projects when sprint stages "
+             "are shared (master_sprint_management.share_sprint_stages)",
+    )
+
+    is_sprint_done = fields.Boolean(
+        string="Done in Sprint",
+        compute="_compute_is_sprint_done",
+        store=True,
+        index=True,
+        help="Tasks in this stage count as done for sprint and epic progress "
+             "(closing or folded stage)",
+    )
+
+    @api.depends("is_closed", "fold")
+    def _compute_is_sprint_done(self):
+        for stage in self:
+            stage.is_sprint_done = stage.is_closed or stage.fold
+
+    def write(self, vals):
+        res = super().write(vals)
+
+        # Done/open split of every sprint using these stages may have changed
+        if "fold" in vals or "is_closed" in vals:
+            sprints = self.env["project.sprint"].search(
+                [("task_ids.stage_id", "in", self.ids)]
+            )
+            sprints._rebuild_task_counters()
+
+        return res
@@ -0,0 +1,2 @@
+from . import project_sprint_velocity_report
+from . import project_task_carryover_report
@@ -0,0 +1,77 @@
+from odoo import fields, models, tools
+
+# Number of closed sprints averaged by the rolling velocity
+ROLLING_WINDOW = 3
+
+
+class ProjectSprintVelocityReport(models.Model):
+    """
+    Velocity across closed sprints, read straight from the snapshot columns
+    of project_sprint. No project.task record is involved.
+    """
+    _name = "project.sprint.velocity.report"
+    _description = "Sprint Velocity Report"
+    _auto = False
+    _order = "close_date desc"
+    _rec_name = "sprint_id"
+
+    sprint_id = fields.Many2one("project.sprint", string="Sprint", readonly=True)
+    project_id = fields.Many2one("project.project", string="Project", readonly=True)
+    close_date = fields.Datetime(string="Close Date", readonly=True)
+    committed_count = fields.Integer(string="Committed", readonly=True)
+    completed_count = fields.Integer(string="Completed", readonly=True)
+    carried_over_count = fields.Integer(string="Carried Over", readonly=True)
+    completion_percentage = fields.Float(
+        string="Completion %", readonly=True, group_operator="avg"
+    )
+    carry_over_rate = fields.Float(
+        string="Carry-over %", readonly=True, group_operator="avg"
+    )
+    rolling_velocity = fields.Float(
+        string="Rolling Velocity",
+        readonly=True,
+        group_operator="avg",
+        help="Average completed tasks over the last %d closed sprints of the project" % ROLLING_WINDOW,
+    )
+    avg_completion_percentage = fields.Float(
+        string="Avg Completion %",
+        readonly=True,
+        group_operator="avg",
+        help="Average completion of the project's closed sprints up to this one",
+    )
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(
+            """
+            CREATE OR REPLACE VIEW %s AS (
+                SELECT sprint.id AS id,
+                       sprint.id AS sprint_id,
+                       sprint.project_id AS project_id,
+                       sprint.end_date AS close_date,
+                       sprint.snapshot_task_count AS committed_count,
+                       sprint.snapshot_done_count AS completed_count,
+                       sprint.snapshot_task_count - sprint.snapshot_done_count AS carried_over_count,
+                       sprint.snapshot_completion_percentage AS completion_percentage,
+                       CASE
+                           WHEN sprint.snapshot_task_count > 0
+                           THEN ROUND(100.0 * (sprint.snapshot_task_count - sprint.snapshot_done_count)
+                                      / sprint.snapshot_task_count, 2)
+                           ELSE 0
+                       END AS carry_over_rate,
+                       AVG(sprint.snapshot_done_count) OVER (
+                           PARTITION BY sprint.project_id
+                           ORDER BY sprint.end_date, sprint.id
+                           ROWS BETWEEN %d PRECEDING AND CURRENT ROW
+                       ) AS rolling_velocity,
+                       AVG(sprint.snapshot_completion_percentage) OVER (
+                           PARTITION BY sprint.project_id
+                           ORDER BY sprint.end_date, sprint.id
+                           ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                       ) AS avg_completion_percentage
+                  FROM project_sprint sprint
+                 WHERE sprint.state = 'closed'
+            )
+            """
+            % (self._table, ROLLING_WINDOW - 1)
+        )
@@ -0,0 +1,39 @@
+from odoo import fields, models, tools
+
+
+class ProjectTaskCarryoverReport(models.Model):
+    """Carry-over counts per task, read only from project_task_sprint_history"""
+    _name = "project.task.carryover.report"
+    _description = "Task Carry-over Analysis"
+    _auto = False
+    _order = "carry_over_count desc"
+    _rec_name = "task_id"
+
+    task_id = fields.Many2one("project.task", string="Task", readonly=True)
+    project_id = fields.Many2one("project.project", string="Project", readonly=True)
+    last_sprint_id = fields.Many2one("project.sprint", string="Last Carried To", readonly=True)
+    carry_over_count = fields.Integer(string="Carry-overs", readonly=True, group_operator="max")
+    sprint_count = fields.Integer(string="Sprints", readonly=True, group_operator="max")
+    first_carry_over = fields.Datetime(string="First Carry-over", readonly=True)
+    last_carry_over = fields.Datetime(string="Last Carry-over", readonly=True)
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(
+            """
+            CREATE OR REPLACE VIEW %s AS (
+                SELECT history.task_id AS id,
+                       history.task_id AS task_id,
+                       (ARRAY_AGG(history.project_id ORDER BY history.date DESC, history.id DESC))[1] AS project_id,
+                       (ARRAY_AGG(history.to_sprint_id ORDER BY history.date DESC, history.id DESC))[1] AS last_sprint_id,
+                       COUNT(*) AS carry_over_count,
+                       COUNT(DISTINCT history.from_sprint_id) AS sprint_count,
+                       MIN(history.date) AS first_carry_over,
+                       MAX(history.date) AS last_carry_over
+                  FROM project_task_sprint_history history
+                 WHERE history.reason = 'carry_over'
+              GROUP BY history.task_id
+            )
+            """
+            % self._table
+        )
@@ -0,0 +1,172 @@
+odoo.define('master_sprint_management.SprintBoardKanbanView', function (require) {
+"use strict";
+
+const core = require('web.core');
+const fieldUtils = require('web.field_utils');
+const KanbanView = require('web.KanbanView');
+const viewRegistry = require('web.view_registry');
+
+const qweb = core.qweb;
+
+// Keep the project kanban behaviour when the project module provides one
+const BaseView = viewRegistry.get('project_task_kanban') || KanbanView;
+
+/**
+ * Renders the sprint banner above the board from a single header RPC
+ * (sprint data + per-stage counts) instead of reading the sprint goal and
+ * dates on every card, and patches the columns from bus notifications
+ * when other users move cards.
+ */
+const SprintBoardKanbanController = BaseView.prototype.config.Controller.extend({
+    events: Object.assign({}, BaseView.prototype.config.Controller.prototype.events, {
+        'click .o_sprint_board_planning': '_onOpenPlanning',
+    }),
+
+    /**
+     * @override
+     */
+    start: async function () {
+        await this._super(...arguments);
+        await this._renderSprintHeader();
+        if (this.sprintHeader) {
+            // The server only grants the channel if the user can read the sprint
+            this.call('bus_service', 'addChannel', this.sprintHeader.channel);
+            this.call('bus_service', 'onNotification', this, this._onBusNotification);
+        }
+    },
+    /**
+     * @override
+     */
+    destroy: function () {
+        if (this.sprintHeader) {
+            this.call('bus_service', 'deleteChannel', this.sprintHeader.channel);
+        }
+        this._super(...arguments);
+    },
+    /**
+     * @override
+     */
+    reload: async function () {
+        const result = await this._super(...arguments);
+        await this._renderSprintHeader();
+        return result;
+    },
+
+    //--------------------------------------------------------------------------
+    // Private
+    //--------------------------------------------------------------------------
+
+    _renderSprintHeader: async function () {
+        const sprintId = this.initialState.context.active_sprint_id;
+        if (!sprintId) {
+            return;
+        }
+        this.sprintHeader = await this._rpc({
+            route: '/master_sprint_management/board/header',
+            params: {sprint_id: sprintId},
+        });
+        this.$('.o_sprint_board_header').remove();
+        this.$('.o_content').before(qweb.render('master_sprint_management.SprintBoardHeader', {
+            header: this.sprintHeader,
+            formatDate: this._formatDate,
+        }));
+    },
+
+    /**
+     * Show a UTC datetime from the server in the user's timezone.
+     *
+     * @param {string|false} value
+     * @returns {string}
+     */
+    _formatDate: function (value) {
+        if (!value) {
+            return '';
+        }
+        return fieldUtils.format.datetime(fieldUtils.parse.datetime(value, null, {isUTC: true}));
+    },
+
+    /**
+     * Reload only the columns a task left or entered, then refresh the
+     * header counts.
+     *
+     * @param {Object[]} tasks compact task updates from the bus
+     */
+    _patchColumns: async function (tasks) {
+        const state = this.model.get(this.handle, {raw: true});
+        const sprintId = this.sprintHeader.sprint.id;
+        const columns = new Set();
+        for (const task of tasks) {
+            for (const group of state.data) {
+                const hasCard = group.data.some(record => record.res_id === task.id);
+                const receivesCard = task.sprint_id === sprintId && group.res_id === task.stage_id;
+                if (hasCard || receivesCard) {
+                    columns.add(group.id);
+                }
+            }
+        }
+        for (const columnID of columns) {
+            await this.model.reload(columnID);
+            this.renderer.updateColumn(columnID, this.model.get(columnID));
+        }
+        if (columns.size) {
+            await this._renderSprintHeader();
+        }
+    },
+
+    //--------------------------------------------------------------------------
+    // Handlers
+    //--------------------------------------------------------------------------
+
+    /**
+     * @param {Object[]} notifications
+     */
+    _onBusNotification: function (notifications) {
+        const tasks = [];
+        for (const {type, payload} of notifications) {
+            if (type === 'sprint_board/tasks' && payload.sprint_id === this.sprintHeader.sprint.id) {
+                tasks.push(...payload.tasks);
+            }
+        }
+        if (tasks.length) {
+            this._patchColumns(tasks);
+        }
+    },
+
+    _onOpenPlanning: async function (ev) {
+        ev.preventDefault();
+        const action = await this._rpc({
+            model: 'project.project',
+            method: 'action_view_backlog',
+            args: [[this.sprintHeader.sprint.project_id]],
+        });
+        this.do_action(action);
+    },
+});
+
+/**
+ * Card drag and drop on the board rewrites backlog ranks, not sequences.
+ */
+const SprintBoardKanbanModel = BaseView.prototype.config.Model.extend({
+    /**
+     * @override
+     */
+    _rpc: function (params, options) {
+        if (params.route === '/web/dataset/resequence' && params.params.model === 'project.task') {
+            params.params.field = 'backlog_rank';
+        }
+        return this._super(params, options);
+    },
+});
+
+const SprintBoardKanbanView = BaseView.extend({
+    config: Object.assign({}, BaseView.prototype.config, {
+        Controller: SprintBoardKanbanController,
+        Model: SprintBoardKanbanModel,
+    }),
+});
+
+viewRegistry.add('sprint_board_kanban', SprintBoardKanbanView);
+
+return SprintBoardKanbanView;
+
+});
@@ -0,0 +1,5 @@
+from . import test_sprint_benchmark
+from . import test_sprint_scale
+from . import test_sprint_load_data
+from . import test_sprint_perf_log
+from . import test_sprint_rollover
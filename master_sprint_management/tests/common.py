@@ -0,0 +1,132 @@
+import logging
+import time
+from collections import namedtuple
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+_logger = logging.getLogger(__name__)
+
+SprintDataset = namedtuple("SprintDataset", ["projects", "sprints", "epics", "tasks"])
+
+# Dataset shapes compared by the scaling assertions. LARGE grows every
+# dimension while staying under the ORM prefetch batch (1000 records), so
+# that a constant query count really means "does not scale with data".
+SMALL = {"projects": 1, "sprints": 3, "tasks": 15, "epics": 2}
+LARGE = {"projects": 5, "sprints": 6, "tasks": 150, "epics": 4}
+
+
+class SprintBenchmarkCase(TransactionCase):
+    """
+    Builds sprint-managed datasets and measures the queries and wall time
+    of an operation on datasets of different sizes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True, mail_notrack=True))
+
+    def _create_dataset(self, projects=1, sprints=3, tasks=15, epics=2, active_sprint=True):
+        """
+        Per project: one closed sprint, one active sprint (unless
+        active_sprint is False) and waiting sprints; tasks spread over the
+        open sprints and the backlog, the stages and the epics.
+        """
+        now = fields.Datetime.now()
+        project_recs = self.env["project.project"].create(
+            [
+                {
+                    "name": "Benchmark %s" % i,
+                    "use_sprint_management": True,
+                    "sprint_close_log_mode": "summary",
+                }
+                for i in range(projects)
+            ]
+        )
+
+        sprint_vals = []
+        for project in project_recs:
+            for i in range(sprints):
+                if i == 0:
+                    state = "closed"
+                elif i == 1 and active_sprint:
+                    state = "active"
+                else:
+                    state = "waiting"
+                start = now + timedelta(weeks=2 * (i - 1))
+                sprint_vals.append(
+                    {
+                        "name": "%s / Sprint %s" % (project.name, i),
+                        "project_id": project.id,
+                        "start_date": start,
+                        "end_date": start + timedelta(weeks=2),
+                        "state": state,
+                    }
+                )
+        sprint_recs = self.env["project.sprint"].create(sprint_vals)
+
+        epic_recs = self.env["project.epic"].create(
+            [
+                {"name": "%s / Epic %s" % (project.name, i), "project_id": project.id}
+                for project in project_recs
+                for i in range(epics)
+            ]
+        )
+
+        task_vals = []
+        for project in project_recs:
+            stages = project.type_ids.sorted("sequence")
+            targets = [s.id for s in sprint_recs if s.project_id == project and s.state != "closed"]
+            targets.append(False)
+            project_epics = [e.id for e in epic_recs if e.project_id == project] or [False]
+            for i in range(tasks):
+                task_vals.append(
+                    {
+                        "name": "%s / Task %s" % (project.name, i),
+                        "project_id": project.id,
+                        "stage_id": stages[i % len(stages)].id,
+                        "sprint_id": targets[i % len(targets)],
+                        "epic_id": project_epics[i % len(project_epics)],
+                    }
+                )
+        task_recs = self.env["project.task"].create(task_vals)
+
+        self._flush()
+        return SprintDataset(project_recs, sprint_recs, epic_recs, task_recs)
+
+    def _flush(self):
+        # Deferred counters and bus notifications run as precommit hooks
+        self.env.cr.precommit.run()
+        self.env["base"].flush()
+
+    def _measure(self, label, operation, dataset):
+        """Run operation(dataset) on a cold cache; return its query count"""
+        self.env["base"].invalidate_cache()
+        queries = self.cr.sql_log_count
+        start = time.perf_counter()
+        operation(dataset)
+        self._flush()
+        queries = self.cr.sql_log_count - queries
+        _logger.info("%s: %d queries in %.3fs", label, queries, time.perf_counter() - start)
+        return queries
+
+    def assertQueryCountConstant(self, operation, shapes=(SMALL, LARGE), **dataset_kwargs):
+        """
+        Assert that operation(dataset) issues the same number of queries on
+        every dataset shape. A first run on a throwaway dataset warms the
+        registry caches so that they do not count against the small shape.
+        """
+        label = operation.__name__
+        self._measure(label + " (warm-up)", operation, self._create_dataset(**dict(shapes[0], **dataset_kwargs)))
+        counts = [
+            self._measure(
+                "%s %s" % (label, shape), operation, self._create_dataset(**dict(shape, **dataset_kwargs))
+            )
+            for shape in shapes
+        ]
+        self.assertEqual(
+            len(set(counts)), 1, "%s query count grows with data size: %s" % (label, counts)
+        )
+        return counts[0]
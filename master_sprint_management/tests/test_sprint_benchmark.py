@@ -0,0 +1,136 @@
+from odoo.tests import tagged
+
+from .common import SprintBenchmarkCase
+
+
+@tagged("post_install", "-at_install", "sprint_benchmark")
+class TestSprintBenchmark(SprintBenchmarkCase):
+    """Query counts of the sprint entry points must not grow with data size"""
+
+    # --------------------------------------------------
+    # COMPUTES
+    # --------------------------------------------------
+    def test_sprint_display(self):
+        def read_sprint_display(dataset):
+            dataset.sprints.read(
+                ["display_task_count", "display_done_count", "display_completion_percentage"]
+            )
+
+        self.assertQueryCountConstant(read_sprint_display)
+
+    def test_backlog_task_count(self):
+        def recompute_backlog_task_count(dataset):
+            field = self.env["project.project"]._fields["backlog_task_count"]
+            self.env.add_to_compute(field, dataset.projects)
+
+        self.assertQueryCountConstant(recompute_backlog_task_count)
+
+    def test_backlog_task_count_assign_one_task(self):
+        def assign_one_backlog_task(dataset):
+            task = dataset.tasks.filtered(lambda t: not t.sprint_id)[:1]
+            sprint = dataset.sprints.filtered(
+                lambda s: s.project_id == task.project_id and s.state == "waiting"
+            )[:1]
+            self.env["base"].invalidate_cache()
+            task.write({"sprint_id": sprint.id})
+
+        self.assertQueryCountConstant(assign_one_backlog_task)
+
+    def test_active_sprint(self):
+        def recompute_active_sprint(dataset):
+            field = self.env["project.project"]._fields["active_sprint_id"]
+            self.env.add_to_compute(field, dataset.projects)
+
+        self.assertQueryCountConstant(recompute_active_sprint)
+
+    def test_epic_display_completion(self):
+        def read_epic_completion(dataset):
+            dataset.epics.read(["display_completion_percentage"])
+
+        self.assertQueryCountConstant(read_epic_completion)
+
+    # --------------------------------------------------
+    # WIZARDS
+    # --------------------------------------------------
+    def test_close_wizard(self):
+        def close_active_sprint(dataset):
+            sprint = dataset.sprints.filtered(lambda s: s.state == "active")[:1]
+            Wizard = self.env["project.sprint.close.wizard"].with_context(default_sprint_id=sprint.id)
+            values = Wizard.default_get(list(Wizard._fields))
+            values.update(action_type="backlog", run_in_background=False)
+            Wizard.create(values).action_close_sprint()
+
+        self.assertQueryCountConstant(close_active_sprint)
+
+    def test_start_wizard(self):
+        def start_waiting_sprint(dataset):
+            sprint = dataset.sprints.filtered(lambda s: s.state == "waiting")[:1]
+            Wizard = self.env["project.sprint.start.wizard"].with_context(
+                default_project_id=sprint.project_id.id,
+                active_model="project.sprint",
+                active_id=sprint.id,
+            )
+            Wizard.create(Wizard.default_get(list(Wizard._fields))).action_start_sprint()
+
+        self.assertQueryCountConstant(start_waiting_sprint, active_sprint=False)
+
+    def test_create_wizard(self):
+        def plan_backlog_into_sprint(dataset):
+            project = dataset.projects[:1]
+            backlog = dataset.tasks.filtered(lambda t: t.project_id == project and not t.sprint_id)
+            Wizard = self.env["project.sprint.create.wizard"].with_context(
+                default_project_id=project.id
+            )
+            values = Wizard.default_get(list(Wizard._fields))
+            values["task_ids"] = [(6, 0, backlog.ids)]
+            Wizard.create(values).action_create_sprint()
+
+        self.assertQueryCountConstant(plan_backlog_into_sprint)
+
+    def test_move_wizard(self):
+        def move_backlog_to_sprint(dataset):
+            project = dataset.projects[:1]
+            backlog = dataset.tasks.filtered(lambda t: t.project_id == project and not t.sprint_id)
+            sprint = dataset.sprints.filtered(
+                lambda s: s.project_id == project and s.state == "waiting"
+            )[:1]
+            Wizard = self.env["project.task.move.sprint"].with_context(
+                active_model="project.task", active_ids=backlog.ids
+            )
+            values = Wizard.default_get(list(Wizard._fields))
+            values["sprint_id"] = sprint.id
+            Wizard.create(values).action_move_tasks()
+
+        self.assertQueryCountConstant(move_backlog_to_sprint)
+
+    # --------------------------------------------------
+    # BACKLOG AND BOARD
+    # --------------------------------------------------
+    def test_backlog_action(self):
+        def open_backlog(dataset):
+            Task = self.env["project.task"]
+            for project in dataset.projects[:1]:
+                action = project.action_view_backlog()
+                Task.search_count(action["domain"])
+                Task.search(action["domain"], order="backlog_rank, id", limit=80)
+
+        self.assertQueryCountConstant(open_backlog)
+
+    def test_board_action(self):
+        def open_board(dataset):
+            Task = self.env["project.task"]
+            sprint = dataset.sprints.filtered(lambda s: s.state == "active")[:1]
+            action = sprint.action_view_sprint_tasks()
+            domain = action["domain"] + [("sprint_id", "=", sprint.id)]
+            Task.read_group(domain, ["stage_id"], ["stage_id"])
+            sprint.get_board_header()
+
+        self.assertQueryCountConstant(open_board)
+
+    def test_board_delta(self):
+        def sync_board(dataset):
+            sprint = dataset.sprints.filtered(lambda s: s.state == "active")[:1]
+            cursor = sprint.get_board_delta()["cursor"]
+            sprint.get_board_delta(since=cursor["since"], ids_hash=cursor["ids_hash"])
+
+        self.assertQueryCountConstant(sync_board)
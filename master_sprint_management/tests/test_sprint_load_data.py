@@ -0,0 +1,54 @@
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestSprintLoadData(TransactionCase):
+
+    def _generate(self, seed):
+        projects = self.env["project.sprint.load.data"]._generate(
+            projects=2, sprints=5, tasks=300, epics=3, seed=seed
+        )
+        tasks = self.env["project.task"].search([("project_id", "in", projects.ids)], order="id")
+        sprint_positions = {
+            sprint: i for i, sprint in enumerate(projects.sprint_ids.sorted(lambda s: (s.project_id.id, s.start_date)))
+        }
+        return projects, [
+            (
+                sprint_positions.get(task.sprint_id),
+                task.stage_id.sequence,
+                task.epic_id.name and task.epic_id.name.rsplit(" ", 1)[-1],
+                bool(task.previous_sprint_id),
+            )
+            for task in tasks
+        ]
+
+    def test_deterministic(self):
+        _projects, first = self._generate(seed=7)
+        _projects, second = self._generate(seed=7)
+        _projects, other = self._generate(seed=8)
+        self.assertEqual(len(first), 300)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_counters(self):
+        projects, _rows = self._generate(seed=1)
+        for sprint in projects.sprint_ids:
+            tasks = sprint.task_ids
+            self.assertEqual(sprint.task_count, len(tasks))
+            self.assertEqual(sprint.done_count, len(tasks.filtered("is_sprint_done")))
+            self.assertEqual(sprint.committed_points, sum(tasks.mapped("story_points")))
+            self.assertEqual(
+                sprint.done_points, sum(tasks.filtered("is_sprint_done").mapped("story_points"))
+            )
+            if sprint.state == "closed":
+                self.assertEqual(sprint.open_count, 0)
+        for project in projects:
+            self.assertEqual(
+                project.backlog_task_count,
+                self.env["project.task"].search_count(
+                    [("project_id", "=", project.id), ("sprint_id", "=", False)]
+                ),
+            )
+            ranks = project.task_ids.sorted("backlog_rank").mapped("backlog_rank")
+            self.assertTrue(all(ranks))
+            self.assertEqual(len(set(ranks)), len(ranks))
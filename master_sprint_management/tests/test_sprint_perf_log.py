@@ -0,0 +1,36 @@
+from odoo.tests import tagged
+
+from .common import SprintBenchmarkCase
+
+
+@tagged("post_install", "-at_install")
+class TestSprintPerfLog(SprintBenchmarkCase):
+
+    def _move_backlog(self, dataset):
+        backlog = dataset.tasks.filtered(lambda t: not t.sprint_id)
+        sprint = dataset.sprints.filtered(lambda s: s.state == "waiting")[:1]
+        self.env["project.task"].move_tasks_to_sprint(backlog.ids, sprint.id)
+        return backlog
+
+    def test_disabled(self):
+        Log = self.env["project.sprint.perf.log"]
+        count = Log.search_count([])
+        self._move_backlog(self._create_dataset())
+        self.assertEqual(Log.search_count([]), count)
+
+    def test_enabled(self):
+        self.env["ir.config_parameter"].sudo().set_param("master_sprint_management.perf_log", "1")
+        backlog = self._move_backlog(self._create_dataset())
+        self._flush()
+
+        log = self.env["project.sprint.perf.log"].search(
+            [("name", "=", "project.task.move_tasks_to_sprint")]
+        )
+        self.assertEqual(len(log), 1)
+        self.assertEqual(log.record_count, len(backlog))
+        self.assertGreater(log.query_count, 0)
+        self.assertTrue(
+            self.env["project.sprint.perf.log"].search_count(
+                [("name", "=", "project.project._compute_backlog_task_count")]
+            )
+        )
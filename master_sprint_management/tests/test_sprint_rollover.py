@@ -0,0 +1,84 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.master_sprint_management.models.project_sprint import ProjectSprint
+
+from .common import SprintBenchmarkCase
+
+
+@tagged("post_install", "-at_install")
+class TestSprintRollover(SprintBenchmarkCase):
+
+    def _create_expired_dataset(self, policies):
+        dataset = self._create_dataset(projects=len(policies))
+        for project, policy in zip(dataset.projects, policies):
+            project.sprint_rollover_policy = policy
+        active = dataset.sprints.filtered(lambda s: s.state == "active")
+        now = fields.Datetime.now()
+        active.write({"start_date": now - timedelta(days=15), "end_date": now - timedelta(days=1)})
+        self._flush()
+        return dataset, active
+
+    def _incomplete(self, sprint):
+        return sprint.task_ids.filtered(lambda t: not t.is_sprint_done)
+
+    def test_rollover_policies(self):
+        dataset, active = self._create_expired_dataset(["manual", "new", "existing", "backlog"])
+        manual, new, existing, backlog = active
+        carried = {sprint: self._incomplete(sprint) for sprint in active}
+        next_waiting = dataset.sprints.filtered(
+            lambda s: s.project_id == existing.project_id and s.state == "waiting"
+        ).sorted("start_date")[:1]
+
+        failed = self.env["project.sprint"]._cron_rollover_expired_sprints(auto_commit=False)
+        self._flush()
+
+        self.assertFalse(failed)
+        self.assertEqual(manual.state, "active")
+        self.assertEqual((new | existing | backlog).mapped("state"), ["closed"] * 3)
+
+        followup = self.env["project.sprint"].search(
+            [("project_id", "=", new.project_id.id), ("state", "=", "active")]
+        )
+        self.assertEqual(followup.start_date, new.end_date)
+        self.assertEqual(followup.task_ids, carried[new])
+
+        self.assertEqual(next_waiting.state, "active")
+        self.assertEqual(carried[existing].sprint_id, next_waiting)
+        self.assertEqual(carried[existing].previous_sprint_id, existing)
+
+        self.assertFalse(carried[backlog].sprint_id)
+        self.assertFalse(backlog.project_id.sprint_ids.filtered(lambda s: s.state == "active"))
+
+    def test_rollover_failure_is_isolated(self):
+        dataset, active = self._create_expired_dataset(["new", "new"])
+        broken, healthy = active
+        rollover = ProjectSprint._rollover
+
+        def flaky_rollover(sprint, target_sprint):
+            if sprint == broken:
+                raise ValueError("boom")
+            return rollover(sprint, target_sprint)
+
+        with patch.object(ProjectSprint, "_rollover", flaky_rollover):
+            failed = self.env["project.sprint"]._cron_rollover_expired_sprints(auto_commit=False)
+        self._flush()
+
+        self.assertEqual(failed, broken)
+        self.assertEqual(broken.state, "active")
+        self.assertEqual(healthy.state, "closed")
+        followup = broken.rollover_target_id
+        self.assertEqual(followup.state, "waiting")
+
+        # The next run reuses the stored follow-up instead of creating another one
+        sprint_count = len(broken.project_id.sprint_ids)
+        failed = self.env["project.sprint"]._cron_rollover_expired_sprints(auto_commit=False)
+        self._flush()
+
+        self.assertFalse(failed)
+        self.assertEqual(broken.state, "closed")
+        self.assertEqual(followup.state, "active")
+        self.assertEqual(len(broken.project_id.sprint_ids), sprint_count)
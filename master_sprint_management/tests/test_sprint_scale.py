@@ -0,0 +1,208 @@
+import json
+import logging
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import SprintBenchmarkCase
+
+_logger = logging.getLogger(__name__)
+
+INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+# Queries added to a project import batch by shared sprint stage provisioning
+SHARED_STAGES_QUERY_BUDGET = 50
+
+
+@tagged("post_install", "-at_install", "-standard", "sprint_benchmark")
+class TestSprintScale(SprintBenchmarkCase):
+    """
+    Production-size checks, too slow for the standard run:
+
+        odoo-bin -d <db> -i master_sprint_management --test-tags sprint_benchmark
+    """
+
+    # --------------------------------------------------
+    # QUERY PLANS ON 1M TASKS
+    # --------------------------------------------------
+    def _clone_rows(self, table, template_id, count, overrides):
+        """
+        Insert `count` copies of a row with raw SQL; `overrides` maps columns
+        to (SQL expression of the series number g, params).
+        """
+        self.env.cr.execute(
+            """
+            SELECT column_name
+              FROM information_schema.columns
+             WHERE table_name = %s AND column_name != 'id'
+          ORDER BY ordinal_position
+            """,
+            [table],
+        )
+        columns = [row[0] for row in self.env.cr.fetchall()]
+        values, params = [], []
+        for column in columns:
+            expression, expression_params = overrides.get(column, ("t.%s" % column, []))
+            values.append(expression)
+            params.extend(expression_params)
+        self.env.cr.execute(
+            """
+            INSERT INTO {table} ({columns})
+                 SELECT {values}
+                   FROM {table} t, generate_series(0, %s - 1) g
+                  WHERE t.id = %s
+            """.format(table=table, columns=", ".join(columns), values=", ".join(values)),
+            params + [count, template_id],
+        )
+
+    def _create_plan_dataset(self, projects=50, sprints=400, tasks=1000000):
+        dataset = self._create_dataset(projects=projects, sprints=3, tasks=10, epics=20)
+        project_ids = dataset.projects.ids
+        pick_project = "(%s::int[])[1 + g %% cardinality(%s::int[])]"
+        round_number = "(g / cardinality(%s::int[]))"
+
+        # Sprints: raw copies spread over the projects and over time
+        self._clone_rows(
+            "project_sprint",
+            dataset.sprints[0].id,
+            projects * sprints,
+            {
+                "project_id": (pick_project, [project_ids, project_ids]),
+                "state": (
+                    "(ARRAY['closed', 'waiting'])[1 + " + round_number + " %% 2]",
+                    [project_ids],
+                ),
+                "start_date": (
+                    "t.start_date + " + round_number + " * interval '14 days'",
+                    [project_ids],
+                ),
+                "end_date": (
+                    "t.end_date + " + round_number + " * interval '14 days'",
+                    [project_ids],
+                ),
+            },
+        )
+        self.env.cr.execute(
+            """
+            SELECT id, project_id, state
+              FROM project_sprint
+             WHERE project_id = ANY(%s) AND state != 'closed'
+          ORDER BY id
+            """,
+            [project_ids],
+        )
+        sprint_ids, sprint_projects, sprint_states = map(list, zip(*self.env.cr.fetchall()))
+
+        # Tasks: one in five in the backlog, the rest in open sprints
+        pick_sprint = "(%s::{type}[])[1 + g %% cardinality(%s::int[])]"
+        self._clone_rows(
+            "project_task",
+            dataset.tasks[0].id,
+            tasks,
+            {
+                "project_id": (pick_sprint.format(type="int"), [sprint_projects, sprint_ids]),
+                "sprint_id": (
+                    "CASE WHEN g %% 5 = 0 THEN NULL ELSE " + pick_sprint.format(type="int") + " END",
+                    [sprint_ids, sprint_ids],
+                ),
+                "sprint_state": (
+                    "CASE WHEN g %% 5 = 0 THEN 'backlog' ELSE " + pick_sprint.format(type="varchar") + " END",
+                    [sprint_states, sprint_ids],
+                ),
+                "epic_id": (pick_project, [dataset.epics.ids, dataset.epics.ids]),
+            },
+        )
+        self.env.cr.execute("ANALYZE project_task")
+        self.env.cr.execute("ANALYZE project_sprint")
+        return dataset
+
+    def _plan_nodes(self, plan):
+        yield plan
+        for child in plan.get("Plans", []):
+            yield from self._plan_nodes(child)
+
+    def assertIndexScan(self, model, domain, order=None, limit=None):
+        query = self.env[model]._search(domain, order=order, limit=limit)
+        sql, params = query.select()
+        self.env.cr.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        plan = self.env.cr.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        nodes = list(self._plan_nodes(plan[0]["Plan"]))
+        _logger.info("%s %s: %s", model, domain, [node["Node Type"] for node in nodes])
+        table = self.env[model]._table
+        self.assertFalse(
+            [n for n in nodes if n["Node Type"] == "Seq Scan" and n.get("Relation Name") == table],
+            "%s %s scans the whole table" % (model, domain),
+        )
+        self.assertTrue(
+            [n for n in nodes if n["Node Type"] in INDEX_SCANS],
+            "%s %s uses no index" % (model, domain),
+        )
+
+    def test_domain_index_scans(self):
+        dataset = self._create_plan_dataset()
+        project = dataset.projects[0]
+        sprint = dataset.sprints.filtered(lambda s: s.project_id == project and s.state == "active")
+        epic = dataset.epics[0]
+
+        # Backlog and board
+        self.assertIndexScan("project.task", project.action_view_backlog()["domain"])
+        self.assertIndexScan("project.task", sprint._get_board_domain())
+        # Next sprint suggested by the close wizard
+        self.assertIndexScan(
+            "project.sprint",
+            [
+                ("project_id", "=", project.id),
+                ("state", "in", ["waiting", "active"]),
+                ("id", "!=", sprint.id),
+                ("start_date", ">=", fields.Datetime.now()),
+            ],
+            order="start_date",
+            limit=1,
+        )
+        # Epic tasks
+        self.assertIndexScan("project.task", [("epic_id", "=", epic.id)])
+
+    # --------------------------------------------------
+    # PROJECT IMPORT
+    # --------------------------------------------------
+    def _count_project_create(self, count, share_stages=False):
+        self.env["ir.config_parameter"].sudo().set_param(
+            "master_sprint_management.share_sprint_stages", share_stages and "1" or ""
+        )
+
+        def import_projects(_dataset):
+            self.env["project.project"].create(
+                [
+                    {"name": "Import %s" % i, "use_sprint_management": True}
+                    for i in range(count)
+                ]
+            )
+
+        return self._measure("create %d projects" % count, import_projects, None)
+
+    def test_project_import_linear(self):
+        """Importing 5,000 projects costs a fixed number of queries per project"""
+        self._count_project_create(100)  # warm-up
+        counts = [self._count_project_create(count) for count in (1250, 2500, 5000)]
+        self.assertAlmostEqual(
+            counts[2] - counts[1],
+            2 * (counts[1] - counts[0]),
+            delta=counts[2] * 0.01,
+            msg="Project create is not linear in the batch size: %s" % counts,
+        )
+
+    def test_project_import_shared_stages(self):
+        """With shared stages, sprint provisioning costs a few queries per batch"""
+        self._count_project_create(100, share_stages=True)  # warm-up
+        count = self._count_project_create(5000, share_stages=True)
+        self.env["ir.config_parameter"].sudo().set_param(
+            "master_sprint_management.share_sprint_stages", ""
+        )
+
+        def import_plain_projects(_dataset):
+            self.env["project.project"].create([{"name": "Plain %s" % i} for i in range(5000)])
+
+        plain = self._measure("create 5000 projects without sprints", import_plain_projects, None)
+        self.assertLessEqual(count - plain, SHARED_STAGES_QUERY_BUDGET, (count, plain))
@@ -1,8 +1,9 @@
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
-from datetime import timedelta
 import logging
 
+from ..models.project_sprint_perf_log import perf_logged
+
 _logger = logging.getLogger(__name__)
 
 
@@ -51,6 +52,11 @@ class ProjectSprintCloseWizard(models.TransientModel):
         string="Select Sprint",
         domain="[('project_id', '=', project_id), ('state', 'in', ['waiting','active']), ('id', '!=', sprint_id)]",
     )
+    run_in_background = fields.Boolean(
+        string="Close in background",
+        help="Move incomplete tasks in committed chunks from a scheduled job. "
+             "The snapshot is still taken now.",
+    )
 
     @api.model
     def default_get(self, fields_list):
@@ -79,26 +85,41 @@ class ProjectSprintCloseWizard(models.TransientModel):
 
     @api.depends("sprint_id")
     def _compute_task_counts(self):
+        split = self.sprint_id._read_done_split()
         for wizard in self:
-            if wizard.sprint_id:
-                completed = wizard.sprint_id.task_ids.filtered(
-                    lambda t: t.stage_id and (t.stage_id.is_closed or t.stage_id.fold)
-                )
-                wizard.completed_task_count = len(completed)
-                wizard.incomplete_task_count = len(wizard.sprint_id.task_ids) - len(completed)
-            else:
-                wizard.completed_task_count = 0
-                wizard.incomplete_task_count = 0
+            done, open_ = split.get(wizard.sprint_id.id, (0, 0, 0.0, 0.0))[:2]
+            wizard.completed_task_count = done
+            wizard.incomplete_task_count = open_
 
     @api.onchange("action_type")
     def _onchange_action_type(self):
         if self.action_type != "existing":
             self.next_sprint_id = False
 
+    def _get_target_sprint(self):
+        """Sprint receiving the incomplete tasks (empty recordset = backlog)"""
+        self.ensure_one()
+
+        if self.action_type == "new":
+            # Auto-create next month's sprint
+            return self.env["project.sprint"].create(
+                self.sprint_id._prepare_followup_values(self.close_date)
+            )
+
+        if self.action_type == "existing":
+            if not self.next_sprint_id:
+                raise UserError(_("Please select a target sprint for incomplete tasks!"))
+            return self.next_sprint_id
+
+        return self.env["project.sprint"]
+
+    @perf_logged(touched=lambda wizard: wizard.incomplete_task_count)
     def action_close_sprint(self):
         self.ensure_one()
 
         sprint = self.sprint_id
+        if sprint.close_job_state in ("pending", "running"):
+            raise UserError(_("This sprint is already being closed in the background."))
 
         # Update end_date if close_date is different
         if self.close_date != sprint.end_date:
@@ -108,109 +129,43 @@ class ProjectSprintCloseWizard(models.TransientModel):
         snapshot_vals = sprint._compute_snapshot_values()
         sprint.write(snapshot_vals)
 
-        incomplete_tasks = sprint.task_ids.filtered(
-            lambda t: not (t.stage_id and (t.stage_id.is_closed or t.stage_id.fold))
+        incomplete_tasks = self.env["project.task"].search(
+            [
+                ("sprint_id", "=", sprint.id),
+                ("is_sprint_done", "=", False),
+            ]
         )
+        target_sprint = self._get_target_sprint() if incomplete_tasks else self.env["project.sprint"]
 
-        if incomplete_tasks:
-            target_sprint = False
-            
-            if self.action_type == "new":
-                # Auto-create next month's sprint
-                start_date = self.close_date
-                month_names = {
-                    1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan",
-                    5: "Mayıs", 6: "Haziran", 7: "Temmuz", 8: "Ağustos",
-                    9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
-                }
-                # Calculate next month
-                next_month = start_date.month + 1
-                next_year = start_date.year
-                if next_month > 12:
-                    next_month = 1
-                    next_year += 1
-                
-                month = month_names.get(next_month, "")
-                year = str(next_year)[2:]
-                new_sprint_name = f"{month} {year}"
-                
-                target_sprint = self.env["project.sprint"].create({
-                    "name": new_sprint_name,
-                    "project_id": self.project_id.id,
-                    "start_date": start_date,
-                    "end_date": start_date + timedelta(weeks=4), # Default 4 weeks for monthly
-                    "state": "waiting",
-                })
-            
-            elif self.action_type == "existing":
-                if not self.next_sprint_id:
-                    raise UserError(_("Please select a target sprint for incomplete tasks!"))
-                target_sprint = self.next_sprint_id
-            
-            if target_sprint:
-                for task in incomplete_tasks:
-                    task.message_post(
-                        body=_(
-                            "<p>Task moved from sprint <strong>%s</strong> "
-                            "to sprint <strong>%s</strong></p>"
-                            "<p>Reason: Sprint closed with incomplete work.</p>"
-                        )
-                        % (sprint.name, target_sprint.name)
-                    )
-
-                incomplete_tasks.write(
-                    {
-                        "previous_sprint_id": sprint.id,
-                        "sprint_id": target_sprint.id,
-                    }
-                )
+        if self.run_in_background:
+            self.env["project.sprint.close.job"]._enqueue(
+                sprint, incomplete_tasks, target_sprint, self.close_date
+            )
+            title = _("Sprint Close Queued")
+            message = _("%d incomplete task(s) will be moved in the background.") % len(
+                incomplete_tasks
+            )
+        else:
+            with self.env["project.task"]._defer_sprint_recompute():
+                sprint._move_incomplete_tasks(incomplete_tasks, target_sprint)
+            sprint._finish_close(incomplete_tasks, target_sprint, self.close_date)
+
+            title = _("Sprint Closed")
+            if not incomplete_tasks:
+                message = _("Sprint closed successfully. All tasks were completed!")
+            elif target_sprint:
                 message = _('%d incomplete task(s) moved to sprint "%s"') % (
                     len(incomplete_tasks),
                     target_sprint.name,
                 )
-
-        elif incomplete_tasks and self.action_type == "backlog":
-            for task in incomplete_tasks:
-                task.message_post(
-                    body=_(
-                        "<p>Task moved from sprint <strong>%s</strong> "
-                        "to <strong>Backlog</strong></p>"
-                        "<p>Reason: Sprint closed with incomplete work.</p>"
-                    )
-                    % sprint.name
-                )
-
-            incomplete_tasks.write({"sprint_id": False})
-            message = _("%d incomplete task(s) moved to backlog") % len(incomplete_tasks)
-
-        else:
-            message = _("Sprint closed successfully. All tasks were completed!")
-
-        sprint.write({"state": "closed"})
-
-        sprint.message_post(
-            body=_(
-                "<p><strong>Sprint Closed Summary:</strong></p>"
-                "<ul>"
-                "<li>Total Tasks (Snapshot): %d</li>"
-                "<li>Done (Snapshot): %d</li>"
-                "<li>Incomplete at close: %d</li>"
-                "<li>Close Date: %s</li>"
-                "</ul>"
-            )
-            % (
-                sprint.snapshot_task_count,
-                sprint.snapshot_done_count,
-                len(incomplete_tasks),
-                self.close_date,
-            )
-        )
+            else:
+                message = _("%d incomplete task(s) moved to backlog") % len(incomplete_tasks)
 
         return {
             "type": "ir.actions.client",
             "tag": "display_notification",
             "params": {
-                "title": _("Sprint Closed"),
+                "title": title,
                 "message": message,
                 "type": "success",
                 "sticky": False,
@@ -2,6 +2,8 @@
 from odoo import api, fields, models, _
 from datetime import timedelta
 
+from ..models.project_sprint_perf_log import perf_logged
+
 
 class ProjectSprintCreateWizard(models.TransientModel):
     _name = "project.sprint.create.wizard"
@@ -87,6 +89,7 @@ class ProjectSprintCreateWizard(models.TransientModel):
         if self.start_date:
             self.name = self._generate_sprint_name(self.start_date)
 
+    @perf_logged(touched=lambda wizard: len(wizard.task_ids))
     def action_create_sprint(self):
         self.ensure_one()
         sprint = self.env["project.sprint"].create({
@@ -98,5 +101,8 @@ class ProjectSprintCreateWizard(models.TransientModel):
             "state": "waiting",
         })
         if self.task_ids:
-            self.task_ids.write({"sprint_id": sprint.id})
+            with self.env["project.task"]._defer_sprint_recompute():
+                self.task_ids.with_context(sprint_move_reason="planning").write(
+                    {"sprint_id": sprint.id}
+                )
         return {"type": "ir.actions.act_window_close"}
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
+from psycopg2 import errors
+
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 from datetime import timedelta
 
+from ..models.project_sprint_perf_log import perf_logged
+
 
 class ProjectSprintStartWizard(models.TransientModel):
     _name = "project.sprint.start.wizard"
@@ -49,6 +53,12 @@ class ProjectSprintStartWizard(models.TransientModel):
     goal = fields.Text(string="Sprint Goal")
     task_ids = fields.Many2many("project.task", string="Tasks")
     task_count = fields.Integer(string="Task Count", compute="_compute_task_count")
+    capacity_points = fields.Float(
+        string="Capacity (Points)",
+        help="Story points the team can take on. Zero disables the capacity check.",
+    )
+    planned_points = fields.Float(string="Planned Points", compute="_compute_planned_points")
+    over_capacity = fields.Boolean(compute="_compute_planned_points")
 
     @api.depends("start_date", "duration")
     def _compute_end_date(self):
@@ -64,6 +74,20 @@ class ProjectSprintStartWizard(models.TransientModel):
         for wizard in self:
             wizard.task_count = len(wizard.task_ids)
 
+    @api.depends("task_ids", "capacity_points")
+    def _compute_planned_points(self):
+        for wizard in self:
+            points = 0.0
+            task_ids = wizard.task_ids._origin.ids
+            if task_ids:
+                # One grouped SUM instead of reading every selected task
+                groups = self.env["project.task"].read_group(
+                    [("id", "in", task_ids)], ["story_points:sum"], []
+                )
+                points = groups and groups[0]["story_points"] or 0.0
+            wizard.planned_points = points
+            wizard.over_capacity = bool(wizard.capacity_points) and points > wizard.capacity_points
+
     @api.model
     def default_get(self, fields_list):
         res = super().default_get(fields_list)
@@ -73,6 +97,8 @@ class ProjectSprintStartWizard(models.TransientModel):
             res["start_date"] = fields.Datetime.now()
         if "sprint_id" in fields_list and self.env.context.get("active_id") and self.env.context.get("active_model") == "project.sprint":
             res["sprint_id"] = self.env.context["active_id"]
+        if "capacity_points" in fields_list and res.get("sprint_id"):
+            res["capacity_points"] = self.env["project.sprint"].browse(res["sprint_id"]).capacity_points
         if "name" in fields_list:
             if res.get("sprint_id"):
                 res["name"] = self.env["project.sprint"].browse(res["sprint_id"]).name
@@ -105,25 +131,12 @@ class ProjectSprintStartWizard(models.TransientModel):
         if self.start_date:
             self.name = self._generate_sprint_name(self.start_date)
 
+    @perf_logged(touched=lambda wizard: len(wizard.task_ids))
     def action_start_sprint(self):
         self.ensure_one()
 
         # Check if there's already an active sprint
-        active_sprint = self.env["project.sprint"].search(
-            [
-                ("project_id", "=", self.project_id.id),
-                ("state", "=", "active"),
-            ],
-            limit=1,
-        )
-        if active_sprint:
-            raise UserError(
-                _(
-                    'There is already an active sprint "%s" in this project. '
-                    "Please close it before starting a new one."
-                )
-                % active_sprint.name
-            )
+        self.project_id._check_can_start_sprint(self.sprint_id)
 
         # Use end_date from wizard
         end_date = self.end_date
@@ -132,32 +145,47 @@ class ProjectSprintStartWizard(models.TransientModel):
         if self.project_id.use_sprint_management:
             self.project_id._ensure_sprint_stages()
 
-        if self.sprint_id:
-            # Update existing planned sprint
-            sprint = self.sprint_id
-            sprint.write({
-                "name": self.name,
-                "start_date": self.start_date,
-                "end_date": end_date,
-                "goal": self.goal,
-                "state": "active",
-            })
-        else:
-            # Create and activate new sprint
-            sprint = self.env["project.sprint"].create({
-                "name": self.name,
-                "project_id": self.project_id.id,
-                "start_date": self.start_date,
-                "end_date": end_date,
-                "goal": self.goal,
-                "state": "active",
-            })
+        # The unique index on active sprints settles concurrent starts
+        try:
+            with self.env.cr.savepoint():
+                if self.sprint_id:
+                    # Update existing planned sprint
+                    sprint = self.sprint_id
+                    sprint.write({
+                        "name": self.name,
+                        "start_date": self.start_date,
+                        "end_date": end_date,
+                        "goal": self.goal,
+                        "capacity_points": self.capacity_points,
+                        "state": "active",
+                    })
+                else:
+                    # Create and activate new sprint
+                    sprint = self.env["project.sprint"].create({
+                        "name": self.name,
+                        "project_id": self.project_id.id,
+                        "start_date": self.start_date,
+                        "end_date": end_date,
+                        "goal": self.goal,
+                        "capacity_points": self.capacity_points,
+                        "state": "active",
+                    })
+        except errors.UniqueViolation:
+            raise UserError(
+                _(
+                    "Another sprint has just been started in this project. "
+                    "Please close it before starting a new one."
+                )
+            )
 
         sprint_name = sprint.name
 
         # Move selected tasks to the new sprint
         if self.task_ids:
-            self.task_ids.write({"sprint_id": sprint.id})
+            with self.env["project.task"]._defer_sprint_recompute():
+                self.task_ids.with_context(sprint_move_reason="planning").write(
+                    {"sprint_id": sprint.id}
+                )
 
         sprint.message_post(
             body=_("<p>Sprint <strong>%s</strong> has been started with %d tasks.</p>") % (sprint.name, len(self.task_ids))
@@ -1,6 +1,8 @@
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 
+from ..models.project_sprint_perf_log import perf_logged
+
 
 class ProjectTaskMoveSprint(models.TransientModel):
     _name = "project.task.move.sprint"
@@ -27,29 +29,31 @@ class ProjectTaskMoveSprint(models.TransientModel):
         res = super().default_get(fields_list)
         active_ids = self.env.context.get("active_ids", [])
         if active_ids:
-            tasks = self.env["project.task"].browse(active_ids)
             res["task_ids"] = [(6, 0, active_ids)]
-            if tasks:
-                res["project_id"] = tasks[0].project_id.id
-
-                projects = tasks.mapped("project_id")
-                if len(projects) > 1:
-                    raise UserError(
-                        _(
-                            "All selected tasks must be from the same project.\n"
-                            "You have selected tasks from: %s"
-                        )
-                        % ", ".join(projects.mapped("name"))
+            project_ids = list(self.env["project.task"]._read_project_groups(active_ids))
+            if len(project_ids) > 1:
+                projects = self.env["project.project"].browse([pid for pid in project_ids if pid])
+                raise UserError(
+                    _(
+                        "All selected tasks must be from the same project.\n"
+                        "You have selected tasks from: %s"
                     )
+                    % ", ".join(projects.mapped("name"))
+                )
+            if project_ids:
+                res["project_id"] = project_ids[0]
         return res
 
+    @perf_logged(touched=lambda wizard: len(wizard.task_ids))
     def action_move_tasks(self):
         self.ensure_one()
 
         if not self.task_ids:
             raise UserError(_("No tasks selected!"))
 
-        self.task_ids.write({"sprint_id": self.sprint_id.id})
+        stats = self.env["project.task"].move_tasks_to_sprint(
+            self.task_ids.ids, self.sprint_id.id
+        )
 
         return {
             "type": "ir.actions.client",
@@ -57,7 +61,7 @@ class ProjectTaskMoveSprint(models.TransientModel):
             "params": {
                 "title": _("Success"),
                 "message": _('%d task(s) moved to sprint "%s"') % (
-                    len(self.task_ids),
+                    stats["moved"],
                     self.sprint_id.name,
                 ),
                 "type": "success",